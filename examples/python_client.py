@@ -2,39 +2,176 @@
 """Example Python client for falcon-messenger API."""
 
 import asyncio
-import base64
+import importlib.util
+import mimetypes
+from dataclasses import asdict, dataclass, field, is_dataclass
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Optional
+from typing import Any, Optional, Union
 
 import httpx
 
 
+def _encode_dataclass(obj: Any) -> dict[str, Any]:
+    """Serialize a metadata dataclass, leaving out fields that are None."""
+    if is_dataclass(obj):
+        return {key: value for key, value in asdict(obj).items() if value is not None}
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+try:
+    import orjson
+
+    def _dumps(obj: Any) -> bytes:
+        return orjson.dumps(
+            obj, default=_encode_dataclass, option=orjson.OPT_PASSTHROUGH_DATACLASS
+        )
+
+    _loads = orjson.loads
+except ImportError:
+    import json
+
+    def _dumps(obj: Any) -> bytes:
+        return json.dumps(obj, default=_encode_dataclass).encode()
+
+    _loads = json.loads
+
+
+@dataclass(slots=True)
+class StockAlertMetadata:
+    """Metadata for a super-signal stock alert.
+
+    Fields left as None, such as an unknown price, are not sent.
+    """
+
+    ticker: str
+    risk_flags: list[str] = field(default_factory=list)
+    risk_count: int = 0
+    price: Optional[float] = None
+    source: str = "super-signal"
+    signal_type: str = "alert"
+
+
+# Retries and multi-target posts resend the same image, so only the most
+# recent encodings are worth keeping; each one is a full base64 copy
+@lru_cache(maxsize=2)
+def _encode_image_cached(path: str, mtime_ns: int, size: int) -> bytes:
+    """Base64-encode an image file without holding a second raw copy in memory.
+
+    mtime_ns and size are part of the cache key so that a modified file is
+    re-encoded instead of served from the cache.
+    """
+    # Imported lazily since most scripts never attach an image
+    import mmap
+
+    try:
+        # SIMD-accelerated drop-in replacement for the stdlib encoder
+        import pybase64 as base64
+    except ImportError:
+        import base64
+
+    if size == 0:
+        return b""
+    with open(path, "rb") as f:
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            return base64.b64encode(mm)
+
+
+def _encode_image(image_path: Path) -> bytes:
+    """Base64-encode an image file, reusing the result for unchanged files."""
+    st = image_path.stat()
+    return _encode_image_cached(str(image_path), st.st_mtime_ns, st.st_size)
+
+
+def _json_body(payload: dict[str, Any], image_b64: Optional[bytes] = None) -> bytes:
+    """Serialize a request payload, splicing in pre-encoded image bytes.
+
+    The base64 data is ASCII-only, so it can be embedded as a JSON string
+    without going through an intermediate str. The parts are joined in one
+    step so the image bytes are copied only once.
+    """
+    body = _dumps(payload)
+    if image_b64 is None:
+        return body
+    return b"".join((body[:-1], b',"image_data":"', image_b64, b'"}'))
+
+
+# Connection pool shared by the FalconMessengerClient instances open at once
+_shared_client: Optional[httpx.AsyncClient] = None
+_shared_client_users = 0
+
+
 class FalconMessengerClient:
-    """Async client for falcon-messenger API."""
+    """Async client for falcon-messenger API.
+
+    Instances share one pooled HTTP client by default, so clients open at the
+    same time reuse connections instead of reconnecting. The pooled client is
+    closed when the last instance using it exits its ``async with`` block.
+    """
+
+    def __init__(
+        self,
+        base_url: str = "http://localhost:8080",
+        client: Optional[httpx.AsyncClient] = None,
+    ):
+        """Initialize the client.
 
-    def __init__(self, base_url: str = "http://localhost:8080"):
+        Args:
+            base_url: Base URL of the falcon-messenger server.
+            client: Optional HTTP client to use. The caller remains responsible
+                for closing it. Defaults to the shared pooled client.
+        """
         self.base_url = base_url.rstrip("/")
-        self._client: Optional[httpx.AsyncClient] = None
+        self._client: Optional[httpx.AsyncClient] = client
+        self._uses_shared_client = False
+
+    @staticmethod
+    def get_shared_client() -> httpx.AsyncClient:
+        """Get or create the HTTP client shared across instances."""
+        global _shared_client
+        if _shared_client is None or _shared_client.is_closed:
+            _shared_client = httpx.AsyncClient(
+                timeout=30.0,
+                # HTTP/2 multiplexing needs the optional h2 package
+                http2=importlib.util.find_spec("h2") is not None,
+                limits=httpx.Limits(max_keepalive_connections=20, max_connections=100),
+            )
+        return _shared_client
 
     async def __aenter__(self):
-        self._client = httpx.AsyncClient(timeout=30.0)
+        global _shared_client_users
+        if self._client is None:
+            self._client = self.get_shared_client()
+            self._uses_shared_client = True
+            _shared_client_users += 1
         return self
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
-        if self._client:
-            await self._client.aclose()
+        # A caller-provided client is left for the caller to close
+        global _shared_client_users
+        if self._uses_shared_client:
+            client = self._client
+            self._uses_shared_client = False
+            self._client = None
+            # A client already closed by close_shared_client() is not counted
+            if client is not _shared_client:
+                return
+            _shared_client_users -= 1
+            if _shared_client_users == 0:
+                # Closing here also keeps the client from outliving its event loop
+                await close_shared_client()
 
     async def health(self) -> dict[str, Any]:
         """Check server health."""
         response = await self._client.get(f"{self.base_url}/health")
         response.raise_for_status()
-        return response.json()
+        return _loads(response.content)
 
     async def config(self) -> dict[str, Any]:
         """Get configuration status."""
         response = await self._client.get(f"{self.base_url}/config")
         response.raise_for_status()
-        return response.json()
+        return _loads(response.content)
 
     async def publish(
         self,
@@ -42,7 +179,8 @@ class FalconMessengerClient:
         targets: Optional[list[str]] = None,
         image_path: Optional[Path] = None,
         image_url: Optional[str] = None,
-        metadata: Optional[dict[str, Any]] = None,
+        metadata: Optional[Union[dict[str, Any], StockAlertMetadata]] = None,
+        use_multipart: bool = False,
     ) -> dict[str, Any]:
         """Publish a message to configured platforms.
 
@@ -52,27 +190,84 @@ class FalconMessengerClient:
             image_path: Optional path to local image file.
             image_url: Optional URL of image to attach.
             metadata: Optional metadata for formatting.
+            use_multipart: Upload image_path as a raw multipart file part via
+                /publish/upload instead of base64-encoding it into JSON.
 
         Returns:
             API response with results for each target.
         """
+        if image_path and use_multipart:
+            return await self._publish_multipart(message, image_path, targets, metadata)
+
         payload: dict[str, Any] = {"message": message}
+        image_b64: Optional[bytes] = None
 
         if targets:
             payload["targets"] = targets
 
         if image_path:
-            image_data = image_path.read_bytes()
-            payload["image_data"] = base64.b64encode(image_data).decode()
+            image_b64 = _encode_image(image_path)
         elif image_url:
             payload["image_url"] = image_url
 
         if metadata:
             payload["metadata"] = metadata
 
-        response = await self._client.post(f"{self.base_url}/publish", json=payload)
+        response = await self._client.post(
+            f"{self.base_url}/publish",
+            content=_json_body(payload, image_b64),
+            headers={"Content-Type": "application/json"},
+        )
+        response.raise_for_status()
+        return _loads(response.content)
+
+    async def _publish_multipart(
+        self,
+        message: str,
+        image_path: Path,
+        targets: Optional[list[str]],
+        metadata: Optional[Union[dict[str, Any], StockAlertMetadata]],
+    ) -> dict[str, Any]:
+        """Publish with the image streamed from disk as multipart/form-data."""
+        data: dict[str, Any] = {"message": message}
+        if targets:
+            data["targets"] = targets
+        if metadata:
+            data["metadata"] = _dumps(metadata).decode()
+
+        mime_type = mimetypes.guess_type(image_path.name)[0] or "image/png"
+        with image_path.open("rb") as f:
+            response = await self._client.post(
+                f"{self.base_url}/publish/upload",
+                data=data,
+                files={"image": (image_path.name, f, mime_type)},
+            )
         response.raise_for_status()
-        return response.json()
+        return _loads(response.content)
+
+    async def publish_many(
+        self,
+        messages: list[str],
+        targets: Optional[list[str]] = None,
+        max_concurrency: int = 10,
+    ) -> list[dict[str, Any]]:
+        """Publish several messages concurrently over the pooled connection.
+
+        Args:
+            messages: Message texts to publish.
+            targets: Optional list of targets for every message.
+            max_concurrency: Maximum number of requests in flight at once.
+
+        Returns:
+            API responses in the same order as the messages.
+        """
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def publish_one(message: str) -> dict[str, Any]:
+            async with semaphore:
+                return await self.publish(message, targets=targets)
+
+        return await asyncio.gather(*(publish_one(m) for m in messages))
 
     async def publish_stock_alert(
         self,
@@ -94,15 +289,12 @@ class FalconMessengerClient:
         Returns:
             API response with results for each target.
         """
-        metadata = {
-            "source": "super-signal",
-            "ticker": ticker,
-            "risk_flags": risk_flags,
-            "risk_count": len(risk_flags),
-            "signal_type": "alert",
-        }
-        if price is not None:
-            metadata["price"] = price
+        metadata = StockAlertMetadata(
+            ticker=ticker,
+            risk_flags=risk_flags,
+            risk_count=len(risk_flags),
+            price=price,
+        )
 
         return await self.publish(
             message=message or f"${ticker} alert",
@@ -111,6 +303,17 @@ class FalconMessengerClient:
         )
 
 
+async def close_shared_client() -> None:
+    """Close the HTTP client shared by FalconMessengerClient instances."""
+    global _shared_client, _shared_client_users
+    # Detach the client before awaiting, so instances entered while it closes
+    # get a new client and start a fresh count
+    client, _shared_client = _shared_client, None
+    _shared_client_users = 0
+    if client:
+        await client.aclose()
+
+
 async def main():
     """Example usage of the FalconMessengerClient."""
     async with FalconMessengerClient() as client:
@@ -2,7 +2,9 @@
 
 import asyncio
 import logging
+import os
 import sys
+from dataclasses import replace
 from pathlib import Path
 from typing import Optional
 
@@ -10,37 +12,91 @@ import click
 
 from falcon_messenger import __version__
 from falcon_messenger.config import Settings
+from falcon_messenger.mime_types import mime_type_for_suffix
+
+_LOG_FORMATTER = logging.Formatter("%(asctime)s - %(name)s - %(levelname)s - %(message)s")
+
+
+def _configure_logging(debug: bool) -> None:
+    """Log to stderr with the shared formatter."""
+    root = logging.getLogger()
+    if not root.handlers:
+        handler = logging.StreamHandler()
+        handler.setFormatter(_LOG_FORMATTER)
+        root.addHandler(handler)
+    root.setLevel(logging.DEBUG if debug else logging.INFO)
+
+
+def _read_file(path: str) -> bytes:
+    """Read a whole file with a single open/fstat/read sequence."""
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        size = os.fstat(fd).st_size
+        chunks = []
+        while size > 0:
+            chunk = os.read(fd, size)
+            if not chunk:
+                break
+            chunks.append(chunk)
+            size -= len(chunk)
+        return b"".join(chunks)
+    finally:
+        os.close(fd)
+
+
+def _get_settings(ctx: click.Context, env_file: Optional[str]) -> Settings:
+    """Load settings once per CLI invocation.
+
+    A subcommand's --env-file takes precedence over the group-level option.
+    """
+    path = env_file or ctx.obj.get("env_file")
+    cache = ctx.obj.setdefault("settings", {})
+    if path not in cache:
+        cache[path] = Settings.from_env(Path(path) if path else None)
+    return cache[path]
 
 
 @click.group()
 @click.version_option(version=__version__)
-def main():
+@click.option(
+    "--env-file",
+    type=click.Path(exists=True),
+    envvar="FALCON_ENV_FILE",
+    help="Path to .env file (applies to all commands)",
+)
+@click.pass_context
+def main(ctx: click.Context, env_file: Optional[str]):
     """falcon-messenger - Publish messages to Bluesky and Discord."""
-    pass
+    ctx.ensure_object(dict)
+    ctx.obj["env_file"] = env_file
 
 
 @main.command()
 @click.option("--host", default=None, help="Host to bind to (default: from config or 0.0.0.0)")
-@click.option("--port", "-p", default=None, type=int, help="Port to bind to (default: from config or 8080)")
+@click.option(
+    "--port", "-p", default=None, type=int, help="Port to bind to (default: from config or 8080)"
+)
 @click.option("--reload", is_flag=True, help="Enable auto-reload for development")
 @click.option("--env-file", type=click.Path(exists=True), help="Path to .env file")
-def serve(host: Optional[str], port: Optional[int], reload: bool, env_file: Optional[str]):
+@click.pass_context
+def serve(
+    ctx: click.Context,
+    host: Optional[str],
+    port: Optional[int],
+    reload: bool,
+    env_file: Optional[str],
+):
     """Start the falcon-messenger API server."""
     import uvicorn
 
     # Load settings to get defaults
-    env_path = Path(env_file) if env_file else None
-    settings = Settings.from_env(env_path)
+    settings = _get_settings(ctx, env_file)
 
     # CLI options override config
     final_host = host or settings.host
     final_port = port or settings.port
 
-    # Configure logging
-    logging.basicConfig(
-        level=logging.DEBUG if settings.debug else logging.INFO,
-        format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-    )
+    _configure_logging(settings.debug)
 
     click.echo(f"Starting falcon-messenger v{__version__}")
     click.echo(f"Listening on http://{final_host}:{final_port}")
@@ -60,17 +116,21 @@ def serve(host: Optional[str], port: Optional[int], reload: bool, env_file: Opti
 @click.option("--target", "-t", multiple=True, help="Target platform (bluesky, discord)")
 @click.option("--image", "-i", type=click.Path(exists=True), help="Path to image file")
 @click.option("--env-file", type=click.Path(exists=True), help="Path to .env file")
-def publish(message: str, target: tuple, image: Optional[str], env_file: Optional[str]):
+@click.pass_context
+def publish(
+    ctx: click.Context,
+    message: str,
+    target: tuple,
+    image: Optional[str],
+    env_file: Optional[str],
+):
     """Publish a message directly (for testing).
 
     Example: falcon-messenger publish "Hello world!" --target bluesky
     """
-    from falcon_messenger.publishers import BlueskyPublisher, DiscordPublisher
+    settings = _get_settings(ctx, env_file)
 
-    env_path = Path(env_file) if env_file else None
-    settings = Settings.from_env(env_path)
-
-    targets = list(target) if target else settings.get_configured_targets()
+    targets = frozenset(target) if target else frozenset(settings.get_configured_targets())
 
     if not targets:
         click.echo("Error: No targets specified and no publishers configured.", err=True)
@@ -80,34 +140,28 @@ def publish(message: str, target: tuple, image: Optional[str], env_file: Optiona
     image_data: Optional[bytes] = None
     image_mime_type: Optional[str] = None
     if image:
-        image_path = Path(image)
-        image_data = image_path.read_bytes()
-        suffix = image_path.suffix.lower()
-        mime_types = {
-            ".png": "image/png",
-            ".jpg": "image/jpeg",
-            ".jpeg": "image/jpeg",
-            ".gif": "image/gif",
-            ".webp": "image/webp",
-        }
-        image_mime_type = mime_types.get(suffix, "image/png")
+        image_data = _read_file(image)
+        image_mime_type = mime_type_for_suffix(os.path.splitext(image)[1].lower())
 
     async def do_publish():
-        results = {}
+        from falcon_messenger.publishers.base import publish_all
+
+        publishers = {}
 
         if "bluesky" in targets and settings.bluesky.is_configured:
-            publisher = BlueskyPublisher(settings.bluesky)
-            result = await publisher.publish(message, image_data, image_mime_type)
-            results["bluesky"] = result
-            await publisher.close()
+            from falcon_messenger.publishers.bluesky import BlueskyPublisher
+
+            publishers["bluesky"] = BlueskyPublisher(settings.bluesky)
 
         if "discord" in targets and settings.discord.is_configured:
-            publisher = DiscordPublisher(settings.discord)
-            result = await publisher.publish(message, image_data, image_mime_type)
-            results["discord"] = result
-            await publisher.close()
+            from falcon_messenger.publishers.discord import DiscordPublisher
+
+            publishers["discord"] = DiscordPublisher(settings.discord)
 
-        return results
+        try:
+            return await publish_all(publishers, message, image_data, image_mime_type)
+        finally:
+            await asyncio.gather(*(publisher.close() for publisher in publishers.values()))
 
     results = asyncio.run(do_publish())
 
@@ -132,13 +186,13 @@ def publish(message: str, target: tuple, image: Optional[str], env_file: Optiona
 @main.command("config")
 @click.option("--check", is_flag=True, help="Check configuration status")
 @click.option("--env-file", type=click.Path(exists=True), help="Path to .env file")
-def config_cmd(check: bool, env_file: Optional[str]):
+@click.pass_context
+def config_cmd(ctx: click.Context, check: bool, env_file: Optional[str]):
     """Check or display configuration.
 
     Example: falcon-messenger config --check
     """
-    env_path = Path(env_file) if env_file else None
-    settings = Settings.from_env(env_path)
+    settings = _get_settings(ctx, env_file)
 
     if check:
         config_status = settings.check_configuration()
@@ -176,10 +230,15 @@ def config_cmd(check: bool, env_file: Optional[str]):
 @click.option("--min-volume", type=int, default=1_000_000, help="Minimum volume to post (default: 1,000,000)")
 @click.option("--no-finviz-check", is_flag=True, help="Skip Finviz RVOL/volume filtering")
 @click.option("--no-tracking", is_flag=True, help="Don't track posted tickers (allow duplicates)")
+@click.option(
+    "--exclude-risk", multiple=True, help="Risk level to never post (repeatable, e.g. High)"
+)
 @click.option("--clear-history", is_flag=True, help="Clear posted tickers history and exit")
 @click.option("--show-history", is_flag=True, help="Show posted tickers history and exit")
 @click.option("--env-file", type=click.Path(exists=True), help="Path to .env file")
+@click.pass_context
 def recommendations_cmd(
+    ctx: click.Context,
     once: bool,
     dry_run: bool,
     interval: Optional[int],
@@ -188,6 +247,7 @@ def recommendations_cmd(
     min_volume: int,
     no_finviz_check: bool,
     no_tracking: bool,
+    exclude_risk: tuple[str, ...],
     clear_history: bool,
     show_history: bool,
     env_file: Optional[str],
@@ -204,33 +264,24 @@ def recommendations_cmd(
         falcon-messenger recommendations --show-history
         falcon-messenger recommendations --clear-history
     """
-    from falcon_messenger.recommendations import (
-        RecommendationsFetcher,
-        RecommendationsScheduler,
-        PostedTickersTracker,
-        FinvizChecker,
-        format_recommendations_table,
-        format_single_recommendation,
-        get_recommendations_list,
-    )
-
-    env_path = Path(env_file) if env_file else None
-    settings = Settings.from_env(env_path)
+    settings = _get_settings(ctx, env_file)
 
     # Override with CLI options
     if endpoint:
-        settings.falcon_endpoint.endpoint_url = endpoint
+        settings = replace(
+            settings, falcon_endpoint=replace(settings.falcon_endpoint, endpoint_url=endpoint)
+        )
     if interval:
-        settings.falcon_endpoint.poll_interval = interval
+        settings = replace(
+            settings, falcon_endpoint=replace(settings.falcon_endpoint, poll_interval=interval)
+        )
 
-    # Configure logging
-    logging.basicConfig(
-        level=logging.DEBUG if settings.debug else logging.INFO,
-        format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-    )
+    _configure_logging(settings.debug)
 
     # Handle history commands first
     if show_history or clear_history:
+        from falcon_messenger.recommendations import PostedTickersTracker
+
         tracker = PostedTickersTracker()
         if show_history:
             posted = tracker.get_posted_tickers()
@@ -256,6 +307,14 @@ def recommendations_cmd(
         click.echo("Set FALCON_DISCORD_WEBHOOK_URL or use --dry-run option.", err=True)
         sys.exit(1)
 
+    from falcon_messenger.recommendations import (
+        FinvizChecker,
+        RecommendationsFetcher,
+        RecommendationsScheduler,
+        format_single_recommendation,
+        get_recommendations_list,
+    )
+
     fetcher = RecommendationsFetcher(settings.falcon_endpoint)
 
     async def run():
@@ -269,15 +328,18 @@ def recommendations_cmd(
                     # Show all recommendations with Finviz check if enabled
                     finviz = FinvizChecker() if not no_finviz_check else None
                     click.echo(f"Found {len(items)} recommendations (min RVOL: {min_rvol}, min Vol: {min_volume:,}):\n")
-                    for i, item in enumerate(items, 1):
-                        ticker = item.get("ticker", "")
-                        rvol = None
-                        volume = None
+                    if finviz:
+                        # Fetch all metrics up front so the Finviz round-trips overlap
+                        all_metrics = await finviz.get_metrics_many(
+                            [item.get("ticker", "") for item in items]
+                        )
+                    else:
+                        all_metrics = [None] * len(items)
+
+                    for i, (item, metrics) in enumerate(zip(items, all_metrics), 1):
+                        rvol = metrics.get("rvol") if metrics else None
+                        volume = metrics.get("volume") if metrics else None
                         if finviz:
-                            metrics = await finviz.get_metrics(ticker)
-                            if metrics:
-                                rvol = metrics.get("rvol")
-                                volume = metrics.get("volume")
                             rvol_pass = rvol is not None and rvol >= min_rvol
                             vol_pass = volume is not None and volume >= min_volume
                             would_post = rvol_pass and vol_pass
@@ -301,6 +363,7 @@ def recommendations_cmd(
                         min_volume=min_volume,
                         check_finviz=not no_finviz_check,
                         track_posted=not no_tracking,
+                        excluded_risk_levels=list(exclude_risk),
                     )
                     posted, total = await scheduler.fetch_and_post_once()
                     click.echo(f"Posted {posted}/{total} recommendations to Discord (RVOL >= {min_rvol}, Vol >= {min_volume:,})")
@@ -315,6 +378,7 @@ def recommendations_cmd(
                     min_volume=min_volume,
                     check_finviz=not no_finviz_check,
                     track_posted=not no_tracking,
+                    excluded_risk_levels=list(exclude_risk),
                 )
                 click.echo(f"Starting recommendations scheduler")
                 click.echo(f"  Interval: {settings.falcon_endpoint.poll_interval}s")
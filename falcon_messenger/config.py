@@ -7,13 +7,25 @@ from typing import Optional
 
 from dotenv import load_dotenv
 
+# Accepted (lowercase) values for boolean environment variables
+_TRUTHY = frozenset({"true", "1", "yes", "on", "t", "y"})
 
-@dataclass
+
+def _env_bool(name: str, default: bool = False) -> bool:
+    """Read a boolean flag from the environment."""
+    value = os.environ.get(name)
+    if value is None:
+        return default
+    return value.lower() in _TRUTHY
+
+
+@dataclass(slots=True, frozen=True)
 class BlueskyConfig:
     """Bluesky configuration."""
 
     handle: Optional[str] = None
     app_password: Optional[str] = None
+    session_file: Optional[str] = None  # Where to persist the session between runs
 
     @property
     def is_configured(self) -> bool:
@@ -21,11 +33,12 @@ class BlueskyConfig:
         return bool(self.handle and self.app_password)
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class DiscordConfig:
     """Discord configuration."""
 
     webhook_url: Optional[str] = None
+    wait: bool = True  # Ask Discord to return the created message (and its ID)
 
     @property
     def is_configured(self) -> bool:
@@ -33,7 +46,7 @@ class DiscordConfig:
         return bool(self.webhook_url)
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class FalconEndpointConfig:
     """Falcon recommendations endpoint configuration."""
 
@@ -47,7 +60,7 @@ class FalconEndpointConfig:
         return bool(self.endpoint_url)
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Settings:
     """Application settings loaded from environment variables."""
 
@@ -57,6 +70,22 @@ class Settings:
     bluesky: BlueskyConfig = field(default_factory=BlueskyConfig)
     discord: DiscordConfig = field(default_factory=DiscordConfig)
     falcon_endpoint: FalconEndpointConfig = field(default_factory=FalconEndpointConfig)
+    # Derived from the (immutable) service configs once at construction
+    _configured_targets: tuple[str, ...] = field(init=False, repr=False, compare=False)
+    _configuration: dict[str, bool] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        targets = []
+        if self.bluesky.is_configured:
+            targets.append("bluesky")
+        if self.discord.is_configured:
+            targets.append("discord")
+        object.__setattr__(self, "_configured_targets", tuple(targets))
+        object.__setattr__(self, "_configuration", {
+            "bluesky": self.bluesky.is_configured,
+            "discord": self.discord.is_configured,
+            "falcon_endpoint": self.falcon_endpoint.is_configured,
+        })
 
     @classmethod
     def from_env(cls, env_file: Optional[Path] = None) -> "Settings":
@@ -76,22 +105,24 @@ class Settings:
         bluesky = BlueskyConfig(
             handle=os.getenv("FALCON_BLUESKY_HANDLE"),
             app_password=os.getenv("FALCON_BLUESKY_APP_PASSWORD"),
+            session_file=os.getenv("FALCON_BLUESKY_SESSION_FILE"),
         )
 
         discord = DiscordConfig(
             webhook_url=os.getenv("FALCON_DISCORD_WEBHOOK_URL"),
+            wait=_env_bool("FALCON_DISCORD_WAIT", default=True),
         )
 
         falcon_endpoint = FalconEndpointConfig(
             endpoint_url=os.getenv("FALCON_ENDPOINT_URL"),
             poll_interval=int(os.getenv("FALCON_POLL_INTERVAL", "300")),
-            verify_ssl=os.getenv("FALCON_VERIFY_SSL", "").lower() in ("true", "1", "yes"),
+            verify_ssl=_env_bool("FALCON_VERIFY_SSL"),
         )
 
         return cls(
             host=os.getenv("FALCON_HOST", "0.0.0.0"),
             port=int(os.getenv("FALCON_PORT", "8080")),
-            debug=os.getenv("FALCON_DEBUG", "").lower() in ("true", "1", "yes"),
+            debug=_env_bool("FALCON_DEBUG"),
             bluesky=bluesky,
             discord=discord,
             falcon_endpoint=falcon_endpoint,
@@ -99,12 +130,7 @@ class Settings:
 
     def get_configured_targets(self) -> list[str]:
         """Get list of configured publishing targets."""
-        targets = []
-        if self.bluesky.is_configured:
-            targets.append("bluesky")
-        if self.discord.is_configured:
-            targets.append("discord")
-        return targets
+        return list(self._configured_targets)
 
     def check_configuration(self) -> dict[str, bool]:
         """Check which services are configured.
@@ -112,8 +138,4 @@ class Settings:
         Returns:
             Dictionary mapping service names to configuration status.
         """
-        return {
-            "bluesky": self.bluesky.is_configured,
-            "discord": self.discord.is_configured,
-            "falcon_endpoint": self.falcon_endpoint.is_configured,
-        }
+        return dict(self._configuration)
@@ -1,12 +1,24 @@
 """Base formatter interface."""
 
 from abc import ABC, abstractmethod
-from typing import Any, Optional
+from typing import Any, ClassVar, Optional
 
 
 class BaseFormatter(ABC):
     """Abstract base class for message formatters."""
 
+    # Metadata 'source' value handled by this formatter, used for dispatch
+    source: ClassVar[str]
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        """Require concrete formatters to declare the source they handle."""
+        super().__init_subclass__(**kwargs)
+        # Subclasses that still leave format() abstract may defer the source
+        if getattr(cls.format, "__isabstractmethod__", False):
+            return
+        if not isinstance(getattr(cls, "source", None), str):
+            raise TypeError(f"{cls.__name__} must define a 'source' string")
+
     @abstractmethod
     def format(self, message: str, metadata: Optional[dict[str, Any]] = None) -> str:
         """Format a message with optional metadata.
@@ -20,7 +32,6 @@ class BaseFormatter(ABC):
         """
         pass
 
-    @abstractmethod
     def can_handle(self, metadata: Optional[dict[str, Any]]) -> bool:
         """Check if this formatter can handle the given metadata.
 
@@ -28,6 +39,8 @@ class BaseFormatter(ABC):
             metadata: The metadata to check.
 
         Returns:
-            True if this formatter should be used.
+            True if the metadata source matches this formatter's source.
         """
-        pass
+        if not metadata:
+            return False
+        return metadata.get("source") == self.source
@@ -1,25 +1,80 @@
 """Formatter for super-signal stock alerts."""
 
+from functools import lru_cache
+from itertools import islice
 from typing import Any, Optional
 
 from falcon_messenger.formatters.base import BaseFormatter
 
+# Header emoji indexed by severity: informational, warning, high risk
+_SEVERITY_EMOJI = (
+    "\U0001F4CA",  # Bar chart (no risk flags)
+    "\u26A0\uFE0F",  # Warning sign (1-2 risk flags)
+    "\U0001F6A8",  # Police car light (3+ risk flags)
+)
+
+# Risk flags listed per alert, and the line prefix used for each
+_MAX_FLAGS = 5
+_FLAG_BULLET = "\n\u2022 "
+
+# Hashtags appended after the ticker tag on every alert
+_TAG_SUFFIX = " #stocks #trading"
+
+
+@lru_cache(maxsize=512, typed=True)
+def _format_alert(
+    message: str,
+    ticker: Optional[str],
+    risk_count: int,
+    risk_flags: tuple[str, ...],
+    price: Optional[float],
+    signal_type: str,
+) -> str:
+    """Build the alert text; memoized since feeds often repeat the same alert."""
+    # Select appropriate emoji based on severity
+    emoji = _SEVERITY_EMOJI[(risk_count >= 1) + (risk_count >= 3)]
+
+    # Header with ticker
+    if ticker:
+        header = f"{emoji} ${ticker}"
+        if signal_type == "alert":
+            header += " Alert"
+        elif signal_type == "signal":
+            header += " Signal"
+    else:
+        header = f"{emoji} Stock Alert"
+
+    # Each optional section carries its own leading newline(s) so the
+    # pieces can be concatenated in a single f-string.
+    price_line = f"\nPrice: ${price:.2f}" if price is not None else ""
+    risk_line = f"\nRisk flags: {risk_count}" if risk_count > 0 else ""
+
+    # List individual risk flags (already limited to _MAX_FLAGS)
+    flags_block = ""
+    if risk_flags:
+        flags_block = "\n" + "".join(f"{_FLAG_BULLET}{flag}" for flag in risk_flags)
+
+    # Original message if different from header. "$<ticker> alert" is
+    # len(ticker) + 7 characters, so most messages fail the length check
+    # before any case folding is done. Tickers parsed from JSON metadata
+    # may be numbers, so compare their text form.
+    msg_block = ""
+    if message and ticker and (
+        len(message) != len(str(ticker)) + 7
+        or message.casefold() != f"${str(ticker).casefold()} alert"
+    ):
+        msg_block = f"\n\n{message}"
+
+    # Add hashtags for discoverability
+    tags = f"\n\n#{ticker}{_TAG_SUFFIX}" if ticker else ""
+
+    return f"{header}\n{price_line}{risk_line}{flags_block}{msg_block}{tags}"
+
 
 class SuperSignalFormatter(BaseFormatter):
     """Formatter for super-signal stock alert messages."""
 
-    def can_handle(self, metadata: Optional[dict[str, Any]]) -> bool:
-        """Check if metadata indicates a super-signal alert.
-
-        Args:
-            metadata: The metadata to check.
-
-        Returns:
-            True if source is 'super-signal'.
-        """
-        if not metadata:
-            return False
-        return metadata.get("source") == "super-signal"
+    source = "super-signal"
 
     def format(self, message: str, metadata: Optional[dict[str, Any]] = None) -> str:
         """Format a super-signal alert for social media.
@@ -36,59 +91,23 @@ class SuperSignalFormatter(BaseFormatter):
 
         ticker = metadata.get("ticker")
         risk_count = metadata.get("risk_count", 0)
-        risk_flags = metadata.get("risk_flags", [])
+        risk_flags = metadata.get("risk_flags") or ()
         price = metadata.get("price")
         signal_type = metadata.get("signal_type", "alert")
 
-        # Select appropriate emoji based on severity
-        if risk_count >= 3:
-            emoji = "\U0001F6A8"  # Police car light (high risk)
-        elif risk_count >= 1:
-            emoji = "\u26A0\uFE0F"  # Warning sign
-        else:
-            emoji = "\U0001F4CA"  # Bar chart (informational)
-
-        # Build the formatted message
-        lines = []
-
-        # Header with ticker
-        if ticker:
-            header = f"{emoji} ${ticker}"
-            if signal_type == "alert":
-                header += " Alert"
-            elif signal_type == "signal":
-                header += " Signal"
-            lines.append(header)
-        else:
-            lines.append(f"{emoji} Stock Alert")
-
-        lines.append("")  # Blank line
-
-        # Price if available
-        if price is not None:
-            lines.append(f"Price: ${price:.2f}")
-
-        # Risk information
-        if risk_count > 0:
-            lines.append(f"Risk flags: {risk_count}")
-
-        # List individual risk flags
-        if risk_flags:
-            lines.append("")
-            for flag in risk_flags[:5]:  # Limit to 5 flags
-                lines.append(f"\u2022 {flag}")
-
-        # Original message if different from header
-        if message and ticker and message.lower() != f"${ticker} alert".lower():
-            lines.append("")
-            lines.append(message)
-
-        # Add hashtags for discoverability
-        if ticker:
-            lines.append("")
-            lines.append(f"#{ticker} #stocks #trading")
-
-        return "\n".join(lines)
+        # Only the first _MAX_FLAGS flags are shown, so only they form the key
+        flags = tuple(islice(risk_flags, _MAX_FLAGS))
+        args = (message, ticker, risk_count, flags, price, signal_type)
+        try:
+            hash(args)
+        except TypeError:
+            # Unhashable metadata values cannot be cached
+            return _format_alert.__wrapped__(*args)
+        return _format_alert(*args)
+
+
+# The formatter is stateless, so format_stock_alert reuses a single instance
+_SHARED_FORMATTER = SuperSignalFormatter()
 
 
 def format_stock_alert(
@@ -108,7 +127,6 @@ def format_stock_alert(
     Returns:
         Formatted alert message.
     """
-    formatter = SuperSignalFormatter()
     metadata = {
         "source": "super-signal",
         "ticker": ticker,
@@ -117,4 +135,4 @@ def format_stock_alert(
         "price": price,
         "signal_type": "alert",
     }
-    return formatter.format(message or "", metadata)
+    return _SHARED_FORMATTER.format(message or "", metadata)
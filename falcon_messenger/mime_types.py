@@ -0,0 +1,71 @@
+"""Image MIME type helpers."""
+
+from typing import Optional
+
+DEFAULT_IMAGE_MIME_TYPE = "image/png"
+
+
+def mime_type_for_suffix(suffix: str) -> str:
+    """Get the image MIME type for a file suffix.
+
+    Args:
+        suffix: Lowercase file suffix including the dot (e.g. '.jpg').
+
+    Returns:
+        The matching MIME type, or DEFAULT_IMAGE_MIME_TYPE if unknown.
+    """
+    match suffix:
+        case ".png":
+            return "image/png"
+        case ".jpg" | ".jpeg":
+            return "image/jpeg"
+        case ".gif":
+            return "image/gif"
+        case ".webp":
+            return "image/webp"
+        case _:
+            return DEFAULT_IMAGE_MIME_TYPE
+
+
+# File extensions for the image types the publishers attach
+_MIME_TO_EXT = {
+    "image/png": "png",
+    "image/jpeg": "jpg",
+    "image/gif": "gif",
+    "image/webp": "webp",
+}
+
+
+def extension_for_mime_type(mime_type: str) -> str:
+    """Get the file extension for an image MIME type.
+
+    Args:
+        mime_type: MIME type such as 'image/jpeg'.
+
+    Returns:
+        The extension without a dot, falling back to the MIME subtype.
+    """
+    ext = _MIME_TO_EXT.get(mime_type)
+    if ext is None:
+        ext = mime_type.rpartition("/")[2]
+    return ext
+
+
+def sniff_mime_type(image: bytes) -> Optional[str]:
+    """Detect the MIME type of image data from its magic bytes.
+
+    Args:
+        image: Raw image data.
+
+    Returns:
+        The detected MIME type, or None if the format is not recognized.
+    """
+    if image.startswith(b"\x89PNG\r\n\x1a\n"):
+        return "image/png"
+    if image.startswith(b"\xff\xd8\xff"):
+        return "image/jpeg"
+    if image.startswith((b"GIF87a", b"GIF89a")):
+        return "image/gif"
+    if image[:4] == b"RIFF" and image[8:12] == b"WEBP":
+        return "image/webp"
+    return None
@@ -2,12 +2,14 @@
 
 from typing import Any, Optional
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class PublishRequest(BaseModel):
     """Request model for publishing a message."""
 
+    model_config = ConfigDict(frozen=True)
+
     message: str = Field(..., description="The message text to publish")
     image_url: Optional[str] = Field(None, description="URL of image to attach")
     image_data: Optional[str] = Field(None, description="Base64-encoded image data")
@@ -22,6 +24,8 @@ class PublishRequest(BaseModel):
 class PublishResultItem(BaseModel):
     """Result of publishing to a single target."""
 
+    model_config = ConfigDict(frozen=True)
+
     success: bool
     post_uri: Optional[str] = Field(None, description="URI/ID of the created post")
     message_id: Optional[str] = Field(None, description="Discord message ID")
@@ -31,6 +35,8 @@ class PublishResultItem(BaseModel):
 class PublishResponse(BaseModel):
     """Response model for publish endpoint."""
 
+    model_config = ConfigDict(frozen=True)
+
     success: bool
     results: dict[str, PublishResultItem]
 
@@ -38,6 +44,8 @@ class PublishResponse(BaseModel):
 class HealthResponse(BaseModel):
     """Response model for health check endpoint."""
 
+    model_config = ConfigDict(frozen=True)
+
     status: str = "ok"
     version: str
     configured_targets: list[str]
@@ -47,6 +55,8 @@ class HealthResponse(BaseModel):
 class ConfigCheckResponse(BaseModel):
     """Response model for configuration check."""
 
+    model_config = ConfigDict(frozen=True)
+
     bluesky_configured: bool
     discord_configured: bool
     configured_targets: list[str]
@@ -1,7 +1,31 @@
 """Publishers for different platforms."""
 
-from falcon_messenger.publishers.base import BasePublisher, PublishResult
-from falcon_messenger.publishers.bluesky import BlueskyPublisher
-from falcon_messenger.publishers.discord import DiscordPublisher
+from importlib import import_module
+from typing import TYPE_CHECKING
 
-__all__ = ["BasePublisher", "PublishResult", "BlueskyPublisher", "DiscordPublisher"]
+from falcon_messenger.publishers.base import BasePublisher, PublishResult, publish_all
+
+if TYPE_CHECKING:
+    from falcon_messenger.publishers.bluesky import BlueskyPublisher
+    from falcon_messenger.publishers.discord import DiscordPublisher
+
+__all__ = [
+    "BasePublisher",
+    "PublishResult",
+    "publish_all",
+    "BlueskyPublisher",
+    "DiscordPublisher",
+]
+
+# Platform publishers are imported on first access so that using one of them
+# does not pull in the client library of the other (e.g. atproto).
+_LAZY_PUBLISHERS = {
+    "BlueskyPublisher": "falcon_messenger.publishers.bluesky",
+    "DiscordPublisher": "falcon_messenger.publishers.discord",
+}
+
+
+def __getattr__(name: str):
+    if name in _LAZY_PUBLISHERS:
+        return getattr(import_module(_LAZY_PUBLISHERS[name]), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,11 +1,12 @@
 """Base publisher interface."""
 
+import asyncio
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
 from typing import Optional
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class PublishResult:
     """Result of a publish operation."""
 
@@ -18,6 +19,8 @@ class PublishResult:
 class BasePublisher(ABC):
     """Abstract base class for all publishers."""
 
+    __slots__ = ()
+
     @property
     @abstractmethod
     def name(self) -> str:
@@ -52,3 +55,33 @@ class BasePublisher(ABC):
     async def close(self) -> None:
         """Clean up resources. Override if needed."""
         pass
+
+
+async def publish_all(
+    publishers: dict[str, BasePublisher],
+    message: str,
+    image: Optional[bytes] = None,
+    image_mime_type: Optional[str] = None,
+) -> dict[str, PublishResult]:
+    """Publish a message to several publishers concurrently.
+
+    Args:
+        publishers: Publishers keyed by target name.
+        message: The text message to publish.
+        image: Optional image data as bytes.
+        image_mime_type: MIME type of the image (e.g., 'image/png').
+
+    Returns:
+        Dictionary mapping target names to publish results, in the same order
+        as the given publishers.
+    """
+    if len(publishers) == 1:
+        # Skip gather's future bookkeeping for the common single-target case
+        [(name, publisher)] = publishers.items()
+        return {name: await publisher.publish(message, image, image_mime_type)}
+
+    names = list(publishers)
+    results = await asyncio.gather(
+        *(publishers[name].publish(message, image, image_mime_type) for name in names)
+    )
+    return dict(zip(names, results))
@@ -1,9 +1,11 @@
 """Bluesky publisher using AT Protocol."""
 
 import logging
+import os
+import time
 from typing import Optional
 
-from atproto import AsyncClient
+from atproto import AsyncClient, Session, SessionEvent
 from atproto_client.models.app.bsky.embed.images import Main as ImagesEmbed
 from atproto_client.models.app.bsky.embed.images import Image
 
@@ -12,10 +14,15 @@ from falcon_messenger.publishers.base import BasePublisher, PublishResult
 
 logger = logging.getLogger(__name__)
 
+# How long a successful health check is reused before asking Bluesky again
+HEALTH_CHECK_TTL_SECONDS = 30.0
+
 
 class BlueskyPublisher(BasePublisher):
     """Publisher for Bluesky social network using AT Protocol."""
 
+    __slots__ = ("config", "_client", "_authenticated", "_healthy_until")
+
     def __init__(self, config: BlueskyConfig):
         """Initialize Bluesky publisher.
 
@@ -25,20 +32,66 @@ class BlueskyPublisher(BasePublisher):
         self.config = config
         self._client: Optional[AsyncClient] = None
         self._authenticated = False
+        self._healthy_until = 0.0
 
     @property
     def name(self) -> str:
         return "bluesky"
 
     async def _ensure_authenticated(self) -> AsyncClient:
-        """Ensure client is authenticated, creating new session if needed."""
+        """Ensure client is authenticated, creating new session if needed.
+
+        A session saved in the configured session file is resumed first, which
+        only needs a token refresh. Password login is the fallback.
+        """
         if self._client is None or not self._authenticated:
-            self._client = AsyncClient()
-            await self._client.login(self.config.handle, self.config.app_password)
+            client = AsyncClient()
+            if self.config.session_file:
+                client.on_session_change(self._save_session)
+            if not await self._resume_session(client):
+                await client.login(self.config.handle, self.config.app_password)
+            self._client = client
             self._authenticated = True
             logger.info(f"Authenticated with Bluesky as {self.config.handle}")
         return self._client
 
+    async def _resume_session(self, client: AsyncClient) -> bool:
+        """Log in with the persisted session string, if there is one.
+
+        Args:
+            client: The client to log in.
+
+        Returns:
+            True if the saved session was resumed.
+        """
+        if not self.config.session_file:
+            return False
+        try:
+            with open(self.config.session_file, encoding="utf-8") as f:
+                session_string = f.read().strip()
+        except FileNotFoundError:
+            return False
+        if not session_string:
+            return False
+        try:
+            await client.login(session_string=session_string)
+            return True
+        except Exception as e:
+            logger.warning(f"Could not resume Bluesky session, logging in again: {e}")
+            return False
+
+    async def _save_session(self, event: SessionEvent, session: Session) -> None:
+        """Persist the session whenever it is created or refreshed."""
+        if event not in (SessionEvent.CREATE, SessionEvent.REFRESH):
+            return
+        try:
+            # The session grants account access, so keep it private to the owner
+            fd = os.open(self.config.session_file, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                f.write(session.encode())
+        except OSError as e:
+            logger.warning(f"Could not save Bluesky session: {e}")
+
     async def publish(
         self, message: str, image: Optional[bytes] = None, image_mime_type: Optional[str] = None
     ) -> PublishResult:
@@ -73,18 +126,28 @@ class BlueskyPublisher(BasePublisher):
     async def health_check(self) -> bool:
         """Check if Bluesky connection is healthy.
 
+        Verifies the session with getSession, which is much lighter than
+        fetching the profile. A successful result is reused for
+        HEALTH_CHECK_TTL_SECONDS.
+
         Returns:
             True if authenticated and can reach Bluesky.
         """
+        if time.monotonic() < self._healthy_until:
+            return True
         try:
             client = await self._ensure_authenticated()
-            profile = await client.get_profile(self.config.handle)
-            return profile is not None
+            session = await client.com.atproto.server.get_session()
         except Exception as e:
             logger.warning(f"Bluesky health check failed: {e}")
             return False
+        if session is None:
+            return False
+        self._healthy_until = time.monotonic() + HEALTH_CHECK_TTL_SECONDS
+        return True
 
     async def close(self) -> None:
         """Clean up Bluesky client resources."""
         self._client = None
         self._authenticated = False
+        self._healthy_until = 0.0
@@ -1,19 +1,31 @@
 """Discord webhook publisher."""
 
+import io
 import logging
 from typing import Optional
 
 import httpx
+import orjson
 
+from falcon_messenger import __version__
 from falcon_messenger.config import DiscordConfig
+from falcon_messenger.mime_types import (
+    DEFAULT_IMAGE_MIME_TYPE,
+    extension_for_mime_type,
+    sniff_mime_type,
+)
 from falcon_messenger.publishers.base import BasePublisher, PublishResult
 
 logger = logging.getLogger(__name__)
 
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
 
 class DiscordPublisher(BasePublisher):
     """Publisher for Discord using webhooks."""
 
+    __slots__ = ("config", "_client", "_post_url")
+
     def __init__(self, config: DiscordConfig):
         """Initialize Discord publisher.
 
@@ -22,15 +34,28 @@ class DiscordPublisher(BasePublisher):
         """
         self.config = config
         self._client: Optional[httpx.AsyncClient] = None
+        # The webhook URL is fixed for the publisher's lifetime
+        self._post_url = f"{config.webhook_url}?wait=true" if config.wait else config.webhook_url
 
     @property
     def name(self) -> str:
         return "discord"
 
     async def _get_client(self) -> httpx.AsyncClient:
-        """Get or create the HTTP client."""
+        """Get or create the pooled HTTP/2 client.
+
+        The publisher lives for the whole server lifespan, so one multiplexed
+        connection to Discord is reused across publishes.
+        """
         if self._client is None:
-            self._client = httpx.AsyncClient(timeout=30.0)
+            self._client = httpx.AsyncClient(
+                http2=True,
+                timeout=httpx.Timeout(30.0, connect=5.0),
+                limits=httpx.Limits(
+                    max_keepalive_connections=20, max_connections=100, keepalive_expiry=60.0
+                ),
+                headers={"User-Agent": f"falcon-messenger/{__version__}"},
+            )
         return self._client
 
     async def publish(
@@ -48,24 +73,24 @@ class DiscordPublisher(BasePublisher):
         """
         try:
             client = await self._get_client()
+            url = self._post_url
 
             if image:
-                mime_type = image_mime_type or "image/png"
-                extension = mime_type.split("/")[-1]
-                files = {"file": (f"image.{extension}", image, mime_type)}
+                # Trust the image bytes over a caller-supplied type
+                mime_type = sniff_mime_type(image) or image_mime_type or DEFAULT_IMAGE_MIME_TYPE
+                extension = extension_for_mime_type(mime_type)
+                # A file-like body is sent in chunks rather than as one buffer
+                files = {"file": (f"image.{extension}", io.BytesIO(image), mime_type)}
                 data = {"content": message}
-                response = await client.post(
-                    f"{self.config.webhook_url}?wait=true", data=data, files=files
-                )
+                response = await client.post(url, data=data, files=files)
             else:
-                json_data = {"content": message}
                 response = await client.post(
-                    f"{self.config.webhook_url}?wait=true", json=json_data
+                    url, content=orjson.dumps({"content": message}), headers=_JSON_HEADERS
                 )
 
             response.raise_for_status()
-            result = response.json()
-            message_id = result.get("id")
+            # Without wait, Discord answers 204 and no message ID is available
+            message_id = response.json().get("id") if self.config.wait else None
             logger.info(f"Published to Discord: message_id={message_id}")
 
             return PublishResult(success=True, message_id=message_id)
@@ -5,11 +5,14 @@ import logging
 import re
 import sqlite3
 import ssl
+import time
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Callable, Optional
 
 import httpx
+import orjson
 
 from falcon_messenger.config import FalconEndpointConfig, DiscordConfig
 
@@ -18,25 +21,95 @@ logger = logging.getLogger(__name__)
 # Default database file for tracking posted recommendations
 DEFAULT_DB_FILE = Path("/tmp/falcon_recommendations.db")
 
+# Connection pool settings for the Finviz, Falcon and Discord clients; idle
+# connections are kept for a minute so a poll's requests reuse them
+_POOL_LIMITS = httpx.Limits(
+    max_connections=50, max_keepalive_connections=20, keepalive_expiry=60.0
+)
+
+# Finviz quote page labels for RVOL and volume, matched against the raw
+# response bytes. Each is followed by the value cell, e.g.
+# <td ...>Rel Volume</td><td ...><b>1.23</b>
+_RVOL_LABEL = b"Rel Volume</td><td"
+_VOLUME_LABEL = b">Volume</td><td"
+
+# Give up on a quote page that has not shown both values within this many bytes
+_FINVIZ_MAX_BYTES = 300_000
+
+
+def _find_cell_value(
+    body: bytes, label: bytes, allowed: bytes, start: int = 0
+) -> tuple[Optional[bytes], int]:
+    """Find the bold value in the cell that follows a label.
+
+    Args:
+        body: Raw HTML of the quote page, possibly only received in part.
+        label: Label text up to the opening of the value cell.
+        allowed: Bytes the value may consist of.
+        start: Offset to search from, as returned by a previous call.
+
+    Returns:
+        Tuple of (value, resume). value is the first non-empty value made only
+        of allowed bytes, or None. resume is the offset to search from once
+        more of the body has arrived, so earlier bytes are not scanned again.
+    """
+    pos = body.find(label, start)
+    while pos != -1:
+        cell_start = pos + len(label)
+        cell_end = body.find(b">", cell_start)
+        if cell_end == -1 or len(body) < cell_end + 3:
+            return None, pos  # Cell not fully received yet
+        if body.startswith(b"<b", cell_end + 1):
+            bold_end = body.find(b">", cell_end + 3)
+            value_end = body.find(b"</b>", bold_end + 1) if bold_end != -1 else -1
+            if value_end == -1:
+                return None, pos
+            value = body[bold_end + 1:value_end]
+            if value and not value.strip(allowed):
+                return value, pos
+        pos = body.find(label, cell_start)
+    # A label may have been cut off at the end of what has arrived so far
+    return None, max(0, len(body) - len(label) + 1)
+
+
+# Exchange ticker symbols, optionally with a share class (e.g. BRK.B, BF-B)
+_TICKER_RE = re.compile(r"[A-Za-z]{1,5}(?:[.-][A-Za-z]{1,2})?")
+
+
+def _item_ticker(item: dict[str, Any]) -> str:
+    """Get the uppercase ticker of a recommendation, or "" if it has none."""
+    ticker = item.get("ticker") or ""
+    if not isinstance(ticker, str):
+        return ""
+    return ticker.upper()
+
+
+# Browser-like headers sent with Finviz requests
+_FINVIZ_HEADERS = {
+    "User-Agent": "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36",
+    "Accept": "text/html,application/xhtml+xml",
+}
+
 
 class FinvizChecker:
     """Check stock metrics from Finviz."""
 
     FINVIZ_URL = "https://finviz.com/quote.ashx"
 
-    def __init__(self):
-        self._client: Optional[httpx.AsyncClient] = None
+    def __init__(self, client: Optional[httpx.AsyncClient] = None):
+        """Initialize the checker.
+
+        Args:
+            client: Optional shared HTTP client. It is left open on close();
+                its owner is responsible for closing it.
+        """
+        self._client = client
+        self._owns_client = client is None
 
     async def _get_client(self) -> httpx.AsyncClient:
-        """Get or create HTTP client with browser-like headers."""
+        """Get or create the HTTP client."""
         if self._client is None:
-            self._client = httpx.AsyncClient(
-                timeout=15.0,
-                headers={
-                    "User-Agent": "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36",
-                    "Accept": "text/html,application/xhtml+xml",
-                },
-            )
+            self._client = httpx.AsyncClient(http2=True, limits=_POOL_LIMITS)
         return self._client
 
     async def get_rvol(self, ticker: str) -> Optional[float]:
@@ -63,29 +136,42 @@ class FinvizChecker:
         try:
             client = await self._get_client()
             url = f"{self.FINVIZ_URL}?t={ticker}"
-            response = await client.get(url)
-            response.raise_for_status()
+            rvol = volume = None
+            rvol_at = volume_at = 0
+
+            # Both values sit in the snapshot table near the top of the page,
+            # so stop downloading as soon as they have been seen
+            async with client.stream(
+                "GET", url, headers=_FINVIZ_HEADERS, timeout=15.0
+            ) as response:
+                response.raise_for_status()
+                body = bytearray()
+                async for chunk in response.aiter_bytes():
+                    body += chunk
+                    if rvol is None:
+                        rvol, rvol_at = _find_cell_value(
+                            body, _RVOL_LABEL, b"0123456789.", rvol_at
+                        )
+                    if volume is None:
+                        volume, volume_at = _find_cell_value(
+                            body, _VOLUME_LABEL, b"0123456789,", volume_at
+                        )
+                    if rvol is not None and volume is not None:
+                        break
+                    if len(body) > _FINVIZ_MAX_BYTES:
+                        break
 
-            html = response.text
             metrics = {}
+            if rvol is not None:
+                metrics["rvol"] = float(rvol)
 
-            # Look for Rel Volume in the Finviz page
-            # Pattern matches: <td ...>Rel Volume</td><td ...><b>1.23</b></td>
-            rvol_pattern = r'Rel Volume</td><td[^>]*><b[^>]*>([0-9.]+)</b>'
-            rvol_match = re.search(rvol_pattern, html)
-            if rvol_match:
-                metrics["rvol"] = float(rvol_match.group(1))
-            else:
-                logger.warning(f"RVOL not found for {ticker}")
-
-            # Look for Volume - format: Volume</td><td ...><b>1,234,567</b>
-            vol_pattern = r'>Volume</td><td[^>]*><b[^>]*>([0-9,]+)</b>'
-            vol_match = re.search(vol_pattern, html)
-            if vol_match:
+            if volume is not None:
                 # Remove commas and convert to int
-                vol_str = vol_match.group(1).replace(",", "")
-                metrics["volume"] = int(vol_str)
-            else:
+                metrics["volume"] = int(volume.replace(b",", b""))
+
+            if "rvol" not in metrics:
+                logger.warning(f"RVOL not found for {ticker}")
+            if "volume" not in metrics:
                 logger.warning(f"Volume not found for {ticker}")
 
             if metrics:
@@ -97,13 +183,59 @@ class FinvizChecker:
             logger.error(f"Error fetching metrics for {ticker}: {e}")
             return None
 
+    async def get_metrics_many(
+        self, tickers: list[str], max_concurrency: int = 5
+    ) -> list[Optional[dict[str, float]]]:
+        """Get RVOL and Volume for several tickers concurrently.
+
+        Each distinct ticker is fetched once, however often it is listed.
+
+        Args:
+            tickers: Stock ticker symbols.
+            max_concurrency: Maximum number of Finviz requests in flight at once.
+
+        Returns:
+            Metrics for each ticker (see get_metrics), in the same order.
+        """
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def fetch(ticker: str) -> Optional[dict[str, float]]:
+            async with semaphore:
+                return await self.get_metrics(ticker)
+
+        unique = list(dict.fromkeys(tickers))
+        results = dict(zip(unique, await asyncio.gather(*(fetch(t) for t in unique))))
+        return [results[ticker] for ticker in tickers]
+
     async def close(self) -> None:
-        """Clean up HTTP client."""
-        if self._client:
+        """Clean up HTTP client resources."""
+        if self._client and self._owns_client:
             await self._client.aclose()
             self._client = None
 
 
+# Schema of the posted tickers table, keyed directly by ticker
+_SQL_CREATE_TABLE = """
+    CREATE TABLE IF NOT EXISTS {table} (
+        ticker TEXT PRIMARY KEY,
+        posted_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        rvol REAL,
+        theme TEXT,
+        sector TEXT
+    ) WITHOUT ROWID
+"""
+
+# Statements run for every candidate ticker. Keeping the exact same strings
+# lets sqlite3's statement cache reuse the compiled statements.
+_SQL_IS_POSTED = "SELECT EXISTS(SELECT 1 FROM posted_tickers WHERE ticker = ?)"
+# posted_at is stamped by SQLite in the same local ISO format that
+# datetime.now().isoformat() produced, so old and new rows sort together
+_SQL_MARK_POSTED = (
+    "INSERT OR REPLACE INTO posted_tickers (ticker, posted_at, rvol, theme, sector) "
+    "VALUES (?, strftime('%Y-%m-%dT%H:%M:%f', 'now', 'localtime'), ?, ?, ?)"
+)
+
+
 class PostedTickersTracker:
     """Track which tickers have been posted to avoid duplicates using SQLite."""
 
@@ -115,22 +247,31 @@ class PostedTickersTracker:
     def _get_conn(self) -> sqlite3.Connection:
         """Get or create database connection."""
         if self._conn is None:
-            self._conn = sqlite3.connect(str(self.db_file))
+            # Autocommit: single statements commit on their own, and batches
+            # use explicit transactions (see mark_posted_many). The scheduler
+            # calls in from worker threads, one call at a time.
+            self._conn = sqlite3.connect(
+                str(self.db_file),
+                isolation_level=None,
+                cached_statements=256,
+                check_same_thread=False,
+            )
+            # WAL with NORMAL sync avoids an fsync per commit and lets readers
+            # proceed while a write is in progress
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            self._conn.execute("PRAGMA temp_store=MEMORY")
+            self._conn.execute("PRAGMA cache_size=-64000")  # 64 MB page cache
+            self._conn.execute("PRAGMA mmap_size=268435456")
         return self._conn
 
     def _init_db(self) -> None:
         """Initialize the database schema."""
         conn = self._get_conn()
-        conn.execute("""
-            CREATE TABLE IF NOT EXISTS posted_tickers (
-                ticker TEXT PRIMARY KEY,
-                posted_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                rvol REAL,
-                theme TEXT,
-                sector TEXT
-            )
-        """)
-        conn.commit()
+        conn.execute(_SQL_CREATE_TABLE.format(table="posted_tickers"))
+        self._migrate_to_without_rowid(conn)
+        # Serves get_posted_tickers' ordering and clear(before_date=...)
+        conn.execute("CREATE INDEX IF NOT EXISTS idx_posted_at ON posted_tickers (posted_at)")
 
         # Count existing records
         cursor = conn.execute("SELECT COUNT(*) FROM posted_tickers")
@@ -138,14 +279,38 @@ class PostedTickersTracker:
         if count > 0:
             logger.info(f"Loaded {count} previously posted tickers from database")
 
+    def _migrate_to_without_rowid(self, conn: sqlite3.Connection) -> None:
+        """Rebuild a table created by older versions as a WITHOUT ROWID table.
+
+        Keying rows directly by ticker avoids the separate primary key index
+        that a rowid table needs.
+        """
+        row = conn.execute(
+            "SELECT sql FROM sqlite_master WHERE type = 'table' AND name = 'posted_tickers'"
+        ).fetchone()
+        if "WITHOUT ROWID" in row[0].upper():
+            return
+
+        logger.info("Migrating posted tickers table to WITHOUT ROWID")
+        conn.execute("BEGIN")
+        try:
+            conn.execute(_SQL_CREATE_TABLE.format(table="posted_tickers_new"))
+            conn.execute(
+                "INSERT INTO posted_tickers_new (ticker, posted_at, rvol, theme, sector) "
+                "SELECT ticker, posted_at, rvol, theme, sector FROM posted_tickers"
+            )
+            conn.execute("DROP TABLE posted_tickers")
+            conn.execute("ALTER TABLE posted_tickers_new RENAME TO posted_tickers")
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        conn.execute("COMMIT")
+
     def is_posted(self, ticker: str) -> bool:
         """Check if ticker has already been posted."""
         conn = self._get_conn()
-        cursor = conn.execute(
-            "SELECT 1 FROM posted_tickers WHERE ticker = ?",
-            (ticker.upper(),)
-        )
-        return cursor.fetchone() is not None
+        cursor = conn.execute(_SQL_IS_POSTED, (ticker.upper(),))
+        return bool(cursor.fetchone()[0])
 
     def mark_posted(
         self,
@@ -156,11 +321,34 @@ class PostedTickersTracker:
     ) -> None:
         """Mark a ticker as posted with metadata."""
         conn = self._get_conn()
-        conn.execute("""
-            INSERT OR REPLACE INTO posted_tickers (ticker, posted_at, rvol, theme, sector)
-            VALUES (?, ?, ?, ?, ?)
-        """, (ticker.upper(), datetime.now().isoformat(), rvol, theme, sector))
-        conn.commit()
+        conn.execute(_SQL_MARK_POSTED, (ticker.upper(), rvol, theme, sector))
+
+    def mark_posted_many(
+        self, records: list[tuple[str, Optional[float], Optional[str], Optional[str]]]
+    ) -> None:
+        """Mark several tickers as posted in a single transaction.
+
+        Args:
+            records: (ticker, rvol, theme, sector) tuples.
+        """
+        if not records:
+            return
+        conn = self._get_conn()
+        conn.execute("BEGIN")
+        try:
+            conn.executemany(
+                _SQL_MARK_POSTED,
+                [(ticker.upper(), rvol, theme, sector) for ticker, rvol, theme, sector in records],
+            )
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        conn.execute("COMMIT")
+
+    def load_posted_set(self) -> set[str]:
+        """Get the set of all posted tickers in a single query."""
+        conn = self._get_conn()
+        return {row[0] for row in conn.execute("SELECT ticker FROM posted_tickers")}
 
     def get_posted_tickers(self) -> list[dict]:
         """Get all posted tickers with metadata."""
@@ -190,7 +378,6 @@ class PostedTickersTracker:
             )
         else:
             cursor = conn.execute("DELETE FROM posted_tickers")
-        conn.commit()
         count = cursor.rowcount
         logger.info(f"Cleared {count} posted tickers")
         return count
@@ -198,6 +385,8 @@ class PostedTickersTracker:
     def close(self) -> None:
         """Close the database connection."""
         if self._conn:
+            # Let SQLite refresh query planner statistics if it needs to
+            self._conn.execute("PRAGMA optimize")
             self._conn.close()
             self._conn = None
 
@@ -218,7 +407,9 @@ class RecommendationsFetcher:
         """Get or create the HTTP client with SSL verification disabled if configured."""
         if self._client is None:
             self._client = httpx.AsyncClient(
+                http2=True,
                 timeout=30.0,
+                limits=_POOL_LIMITS,
                 verify=self.config.verify_ssl,  # False allows self-signed certs
             )
         return self._client
@@ -241,7 +432,7 @@ class RecommendationsFetcher:
         response = await client.get(self.config.endpoint_url)
         response.raise_for_status()
 
-        data = response.json()
+        data = orjson.loads(response.content)
         logger.info(f"Fetched {len(data) if isinstance(data, list) else 1} recommendations")
         return data
 
@@ -252,6 +443,44 @@ class RecommendationsFetcher:
             self._client = None
 
 
+class TokenBucket:
+    """Token-bucket rate limiter that allows short bursts."""
+
+    def __init__(self, rate: int = 5, per: float = 2.0):
+        """Initialize the bucket full.
+
+        Args:
+            rate: Number of acquisitions allowed per period (the burst size).
+            per: Period length in seconds.
+        """
+        self.rate = rate
+        self.per = per
+        self._tokens = float(rate)
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self) -> None:
+        """Wait until a token is available and take it."""
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                refill = (now - self._updated) * self.rate / self.per
+                self._tokens = min(self.rate, self._tokens + refill)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                await asyncio.sleep((1 - self._tokens) * self.per / self.rate)
+
+
+# Metric markers for single recommendations
+_EMOJI_HIGH_RVOL = "\N{FIRE}"
+_EMOJI_NORMAL_RVOL = "\N{BAR CHART}"
+_EMOJI_HIGH_VOLUME = "\N{CHART WITH UPWARDS TREND}"
+_EMOJI_LOW_VOLUME = "\N{CHART WITH DOWNWARDS TREND}"
+
+
+@lru_cache(maxsize=1024)
 def format_volume(volume: int) -> str:
     """Format volume with K/M suffix."""
     if volume >= 1_000_000:
@@ -298,10 +527,10 @@ def format_single_recommendation(
     if rvol is not None or volume is not None:
         metrics_parts = []
         if rvol is not None:
-            rvol_emoji = "🔥" if rvol >= 2 else "📊"
+            rvol_emoji = _EMOJI_HIGH_RVOL if rvol >= 2 else _EMOJI_NORMAL_RVOL
             metrics_parts.append(f"{rvol_emoji} RVOL: {rvol:.2f}")
         if volume is not None:
-            vol_emoji = "📈" if volume >= 1_000_000 else "📉"
+            vol_emoji = _EMOJI_HIGH_VOLUME if volume >= 1_000_000 else _EMOJI_LOW_VOLUME
             metrics_parts.append(f"{vol_emoji} Vol: {format_volume(volume)}")
         lines.append(" | ".join(metrics_parts))
 
@@ -368,40 +597,40 @@ def format_recommendations_table(data: Any, max_length: int = 1900) -> str:
         val = str(val) if val else ""
         return val[:max_len-2] + ".." if len(val) > max_len else val
 
-    # Calculate column widths (with limits)
-    col_widths = {}
-    for col in columns:
-        col_width = min(len(str(col)), 15)
-        for item in items:
-            val = truncate(str(item.get(col, "")), 25)
-            col_width = max(col_width, min(len(val), 25))
-        col_widths[col] = col_width
+    # Render every cell once, then size columns from the rendered values
+    cells = [[truncate(str(item.get(col, "")), 25) for col in columns] for item in items]
+    col_widths = [min(len(str(col)), 15) for col in columns]
+    for row_cells in cells:
+        for i, cell in enumerate(row_cells):
+            if len(cell) > col_widths[i]:
+                col_widths[i] = len(cell)
 
     timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
     header_text = f"**Falcon Recommendations** ({timestamp})\n```\n"
     footer_text = "\n```"
 
-    # Build table iteratively, checking length
+    # Build table iteratively, tracking its length against the budget
     lines = []
 
+    # One template pads (and, for the header, truncates) every column
+    row_format = " | ".join(f"{{:<{width}.{width}}}" for width in col_widths)
+
     # Header
-    header = " | ".join(str(col)[:col_widths[col]].ljust(col_widths[col]) for col in columns)
+    header = row_format.format(*map(str, columns))
     lines.append(header)
 
     # Separator
-    separator = "-+-".join("-" * col_widths[col] for col in columns)
+    separator = "-+-".join("-" * width for width in col_widths)
     lines.append(separator)
 
     # Data rows - add as many as fit
-    for item in items:
-        row = " | ".join(
-            truncate(str(item.get(col, "")), col_widths[col]).ljust(col_widths[col])
-            for col in columns
-        )
-        test_table = "\n".join(lines + [row])
-        full_message = header_text + test_table + footer_text
+    budget = max_length - len(header_text) - len(footer_text)
+    table_length = len(header) + 1 + len(separator)
+    for row_cells in cells:
+        row = row_format.format(*row_cells)
+        table_length += 1 + len(row)
 
-        if len(full_message) > max_length:
+        if table_length > budget:
             # Can't fit more rows
             if len(lines) > 2:  # Have at least header + separator
                 lines.append(f"... and {len(items) - (len(lines) - 2)} more")
@@ -445,6 +674,7 @@ class RecommendationsScheduler:
         check_finviz: bool = True,
         track_posted: bool = True,
         state_file: Optional[Path] = None,
+        excluded_risk_levels: Optional[list[str]] = None,
     ):
         """Initialize the scheduler.
 
@@ -457,25 +687,44 @@ class RecommendationsScheduler:
             check_finviz: Whether to check RVOL/volume from Finviz.
             track_posted: Whether to track posted tickers to avoid duplicates.
             state_file: Optional path for state file.
+            excluded_risk_levels: Risk levels never to post (case-insensitive).
         """
         self.fetcher = fetcher
         self.discord_webhook_url = discord_webhook_url
+        self._discord_post_url = f"{discord_webhook_url}?wait=true"
+        # Discord allows webhooks about 5 messages per 2 seconds
+        self._discord_bucket = TokenBucket(rate=5, per=2.0)
+        # Monotonic time before which Discord has asked us not to post
+        self._discord_resume_at = 0.0
         self.poll_interval = poll_interval
         self.min_rvol = min_rvol
         self.min_volume = min_volume
+        self._min_volume_str = format_volume(min_volume)  # Used in log messages
         self.check_finviz = check_finviz
         self.track_posted = track_posted
+        self.excluded_risk_levels = frozenset(
+            level.casefold() for level in excluded_risk_levels or ()
+        )
         self._running = False
         self._task: Optional[asyncio.Task] = None
-        self._discord_client: Optional[httpx.AsyncClient] = None
-        self._finviz = FinvizChecker() if check_finviz else None
+        # Shared by Discord posts and Finviz lookups, created on first use. The
+        # fetcher keeps its own client since it may be configured to skip
+        # certificate verification.
+        self._client: Optional[httpx.AsyncClient] = None
+        self._finviz: Optional[FinvizChecker] = None
+        # Bounds concurrent Finviz lookups when a batch is checked at once
+        self._finviz_sem = asyncio.Semaphore(5)
         self._tracker = PostedTickersTracker(state_file or DEFAULT_DB_FILE) if track_posted else None
 
-    async def _get_discord_client(self) -> httpx.AsyncClient:
-        """Get or create the Discord HTTP client."""
-        if self._discord_client is None:
-            self._discord_client = httpx.AsyncClient(timeout=30.0)
-        return self._discord_client
+    async def _get_client(self) -> httpx.AsyncClient:
+        """Get or create the shared HTTP client, and the Finviz checker using it."""
+        if self._client is None:
+            self._client = httpx.AsyncClient(http2=True, timeout=30.0, limits=_POOL_LIMITS)
+            if self.check_finviz:
+                # Repeated tickers within a poll are dropped before any lookup,
+                # so each ticker is fetched at most once per poll
+                self._finviz = FinvizChecker(client=self._client)
+        return self._client
 
     async def _post_to_discord(self, message: str) -> bool:
         """Post a message to Discord webhook.
@@ -487,11 +736,11 @@ class RecommendationsScheduler:
             True if successful, False otherwise.
         """
         try:
-            client = await self._get_discord_client()
-            response = await client.post(
-                f"{self.discord_webhook_url}?wait=true",
-                json={"content": message},
-            )
+            response = await self._send_to_discord(message)
+            if response.status_code == 429:
+                # Retry once after the wait Discord asked for
+                logger.warning("Discord rate limit hit, retrying after cooldown")
+                response = await self._send_to_discord(message)
             response.raise_for_status()
             logger.info("Posted recommendations to Discord")
             return True
@@ -499,28 +748,83 @@ class RecommendationsScheduler:
             logger.error(f"Failed to post to Discord: {e}")
             return False
 
-    async def _should_post(self, item: dict[str, Any]) -> tuple[bool, Optional[dict]]:
+    async def _send_to_discord(self, message: str) -> httpx.Response:
+        """Send one webhook request, pacing it by Discord's rate limit headers.
+
+        Args:
+            message: Message content to post.
+
+        Returns:
+            The webhook response.
+        """
+        delay = self._discord_resume_at - time.monotonic()
+        if delay > 0:
+            await asyncio.sleep(delay)
+        await self._discord_bucket.acquire()
+
+        client = await self._get_client()
+        response = await client.post(
+            self._discord_post_url,
+            json={"content": message},
+        )
+
+        headers = response.headers
+        if response.status_code == 429:
+            wait = float(headers.get("Retry-After") or headers.get("X-RateLimit-Reset-After", 1))
+        elif headers.get("X-RateLimit-Remaining") == "0":
+            wait = float(headers.get("X-RateLimit-Reset-After", 0))
+        else:
+            wait = 0.0
+        if wait > 0:
+            self._discord_resume_at = time.monotonic() + wait
+        return response
+
+    async def _should_post(
+        self, item: dict[str, Any], posted: set[str], seen: Optional[set[str]] = None
+    ) -> tuple[bool, Optional[dict]]:
         """Check if a recommendation should be posted.
 
         Args:
             item: Recommendation item.
+            posted: Uppercase tickers that have already been posted.
+            seen: Uppercase tickers already checked in this batch. Repeats of a
+                ticker are rejected without another Finviz lookup.
 
         Returns:
             Tuple of (should_post, metrics_dict with 'rvol' and 'volume').
         """
-        ticker = item.get("ticker", "")
+        ticker = _item_ticker(item)
         if not ticker:
             return False, None
 
         # Check if already posted
-        if self._tracker and self._tracker.is_posted(ticker):
+        if ticker in posted:
             logger.debug(f"{ticker}: Already posted, skipping")
             return False, None
 
+        risk = item.get("risk_level")
+        if risk and str(risk).casefold() in self.excluded_risk_levels:
+            logger.info(f"{ticker}: Risk level {risk} excluded, skipping")
+            return False, None
+
+        if seen is not None:
+            if ticker in seen:
+                logger.debug(f"{ticker}: Duplicate in this batch, skipping")
+                return False, None
+            seen.add(ticker)
+
         # Check RVOL and Volume from Finviz
+        if self.check_finviz and self._finviz is None:
+            await self._get_client()  # Creates the checker on the shared client
         metrics = None
         if self._finviz:
-            metrics = await self._finviz.get_metrics(ticker)
+            # Finviz only quotes exchange symbols; skip the request for anything else
+            if not _TICKER_RE.fullmatch(ticker):
+                logger.warning(f"{ticker}: Not a Finviz ticker symbol, skipping")
+                return False, None
+
+            async with self._finviz_sem:
+                metrics = await self._finviz.get_metrics(ticker)
             if metrics is None:
                 logger.warning(f"{ticker}: Could not fetch metrics, skipping")
                 return False, None
@@ -537,16 +841,63 @@ class RecommendationsScheduler:
             # Check Volume threshold
             if volume is None or volume < self.min_volume:
                 vol_str = format_volume(volume) if volume else "N/A"
-                logger.info(f"{ticker}: Volume {vol_str} < {format_volume(self.min_volume)}, skipping")
+                logger.info(f"{ticker}: Volume {vol_str} < {self._min_volume_str}, skipping")
                 return False, metrics
 
             logger.info(f"{ticker}: PASS - RVOL {rvol:.2f}, Vol {format_volume(volume)}")
 
         return True, metrics
 
+    async def _post_items(self, items: list[dict[str, Any]]) -> int:
+        """Check recommendations and post the ones that pass to Discord.
+
+        The checks run concurrently; posts are sent one at a time.
+
+        Args:
+            items: Recommendation items.
+
+        Returns:
+            Number of recommendations posted.
+        """
+        # One query up front instead of one lookup per candidate. SQLite calls
+        # run in a worker thread so disk syncs don't stall the event loop.
+        if self._tracker:
+            posted = await asyncio.to_thread(self._tracker.load_posted_set)
+        else:
+            posted = set()
+        seen: set[str] = set()
+        checks = await asyncio.gather(*(self._should_post(item, posted, seen) for item in items))
+
+        posted_count = 0
+        records = []
+        try:
+            for item, (should_post, metrics) in zip(items, checks):
+                ticker = _item_ticker(item)
+
+                # Repeats within the batch were already rejected via `seen`
+                if not should_post:
+                    continue
+
+                # Extract metrics
+                rvol = metrics.get("rvol") if metrics else None
+                volume = metrics.get("volume") if metrics else None
+
+                # Format and post
+                message = format_single_recommendation(item, rvol, volume)
+                if await self._post_to_discord(message):
+                    posted_count += 1
+                    posted.add(ticker)
+                    records.append((ticker, rvol, item.get("theme"), item.get("sector")))
+        finally:
+            # Record everything posted so far, even if the batch is interrupted
+            if self._tracker:
+                await asyncio.to_thread(self._tracker.mark_posted_many, records)
+
+        return posted_count
+
     async def _poll_loop(self) -> None:
         """Main polling loop."""
-        logger.info(f"Starting recommendations polling (interval: {self.poll_interval}s, min_rvol: {self.min_rvol}, min_vol: {format_volume(self.min_volume)})")
+        logger.info(f"Starting recommendations polling (interval: {self.poll_interval}s, min_rvol: {self.min_rvol}, min_vol: {self._min_volume_str})")
 
         while self._running:
             try:
@@ -554,36 +905,8 @@ class RecommendationsScheduler:
                 data = await self.fetcher.fetch()
                 items = get_recommendations_list(data)
 
-                posted_count = 0
-                for item in items:
-                    ticker = item.get("ticker", "")
-
-                    # Check if should post
-                    should_post, metrics = await self._should_post(item)
-                    if not should_post:
-                        continue
-
-                    # Extract metrics
-                    rvol = metrics.get("rvol") if metrics else None
-                    volume = metrics.get("volume") if metrics else None
-
-                    # Format and post
-                    message = format_single_recommendation(item, rvol, volume)
-                    if await self._post_to_discord(message):
-                        posted_count += 1
-                        # Mark as posted with metadata
-                        if self._tracker:
-                            self._tracker.mark_posted(
-                                ticker,
-                                rvol=rvol,
-                                theme=item.get("theme"),
-                                sector=item.get("sector"),
-                            )
-
-                    # Small delay between posts to avoid rate limiting
-                    await asyncio.sleep(2)
-
-                logger.info(f"Posted {posted_count}/{len(items)} recommendations (RVOL >= {self.min_rvol}, Vol >= {format_volume(self.min_volume)})")
+                posted_count = await self._post_items(items)
+                logger.info(f"Posted {posted_count}/{len(items)} recommendations (RVOL >= {self.min_rvol}, Vol >= {self._min_volume_str})")
 
             except Exception as e:
                 logger.error(f"Error in recommendations poll: {e}")
@@ -613,12 +936,13 @@ class RecommendationsScheduler:
                 pass
             self._task = None
 
-        if self._discord_client:
-            await self._discord_client.aclose()
-            self._discord_client = None
-
         if self._finviz:
             await self._finviz.close()
+            self._finviz = None
+
+        if self._client:
+            await self._client.aclose()
+            self._client = None
 
         if self._tracker:
             self._tracker.close()
@@ -649,36 +973,8 @@ class RecommendationsScheduler:
                 logger.warning("No recommendations to post")
                 return 0, 0
 
-            posted_count = 0
-            for item in items:
-                ticker = item.get("ticker", "")
-
-                # Check if should post
-                should_post, metrics = await self._should_post(item)
-                if not should_post:
-                    continue
-
-                # Extract metrics
-                rvol = metrics.get("rvol") if metrics else None
-                volume = metrics.get("volume") if metrics else None
-
-                # Format and post
-                message = format_single_recommendation(item, rvol, volume)
-                if await self._post_to_discord(message):
-                    posted_count += 1
-                    # Mark as posted with metadata
-                    if self._tracker:
-                        self._tracker.mark_posted(
-                            ticker,
-                            rvol=rvol,
-                            theme=item.get("theme"),
-                            sector=item.get("sector"),
-                        )
-
-                # Small delay between posts to avoid rate limiting
-                await asyncio.sleep(2)
-
-            logger.info(f"Posted {posted_count}/{len(items)} recommendations (RVOL >= {self.min_rvol}, Vol >= {format_volume(self.min_volume)})")
+            posted_count = await self._post_items(items)
+            logger.info(f"Posted {posted_count}/{len(items)} recommendations (RVOL >= {self.min_rvol}, Vol >= {self._min_volume_str})")
             return posted_count, len(items)
         except Exception as e:
             logger.error(f"Failed to fetch and post: {e}")
@@ -1,17 +1,18 @@
 """FastAPI server for falcon-messenger."""
 
-import asyncio
-import base64
+import binascii
 import logging
 from contextlib import asynccontextmanager
 from typing import Any, Optional
 
 import httpx
-from fastapi import FastAPI, HTTPException
+import orjson
+from fastapi import FastAPI, File, Form, HTTPException, UploadFile
 
 from falcon_messenger import __version__
 from falcon_messenger.config import Settings
-from falcon_messenger.formatters import SuperSignalFormatter
+from falcon_messenger.formatters import BaseFormatter, SuperSignalFormatter
+from falcon_messenger.mime_types import DEFAULT_IMAGE_MIME_TYPE, sniff_mime_type
 from falcon_messenger.models import (
     ConfigCheckResponse,
     HealthResponse,
@@ -20,7 +21,7 @@ from falcon_messenger.models import (
     PublishResultItem,
 )
 from falcon_messenger.publishers import BlueskyPublisher, DiscordPublisher
-from falcon_messenger.publishers.base import BasePublisher
+from falcon_messenger.publishers.base import BasePublisher, publish_all
 
 logger = logging.getLogger(__name__)
 
@@ -31,10 +32,20 @@ class PublisherManager:
     def __init__(self, settings: Settings):
         self.settings = settings
         self.publishers: dict[str, BasePublisher] = {}
-        self.formatters = [SuperSignalFormatter()]
+        self.formatters: dict[str, BaseFormatter] = {
+            formatter.source: formatter for formatter in (SuperSignalFormatter(),)
+        }
+        self.image_client: Optional[httpx.AsyncClient] = None
 
     async def initialize(self) -> None:
         """Initialize configured publishers."""
+        # Shared across requests so repeated image fetches reuse connections
+        self.image_client = httpx.AsyncClient(
+            http2=True,
+            timeout=30.0,
+            limits=httpx.Limits(max_keepalive_connections=16),
+        )
+
         if self.settings.bluesky.is_configured:
             self.publishers["bluesky"] = BlueskyPublisher(self.settings.bluesky)
             logger.info("Bluesky publisher initialized")
@@ -49,12 +60,21 @@ class PublisherManager:
             await publisher.close()
         self.publishers.clear()
 
+        if self.image_client:
+            await self.image_client.aclose()
+            self.image_client = None
+
     def format_message(self, message: str, metadata: Optional[dict[str, Any]]) -> str:
-        """Apply appropriate formatter to message."""
-        for formatter in self.formatters:
-            if formatter.can_handle(metadata):
-                return formatter.format(message, metadata)
-        return message
+        """Apply the formatter registered for the metadata source, if any."""
+        if not metadata:
+            return message
+        source = metadata.get("source")
+        if not isinstance(source, str):
+            return message
+        formatter = self.formatters.get(source)
+        if formatter is None:
+            return message
+        return formatter.format(message, metadata)
 
     async def publish(
         self,
@@ -81,27 +101,24 @@ class PublisherManager:
 
         # Determine targets
         if targets:
-            target_list = [t for t in targets if t in self.publishers]
+            selected = {t: self.publishers[t] for t in targets if t in self.publishers}
         else:
-            target_list = list(self.publishers.keys())
+            selected = self.publishers
 
-        if not target_list:
+        if not selected:
             return {}
 
         # Publish to all targets concurrently
-        async def publish_to_target(name: str) -> tuple[str, PublishResultItem]:
-            publisher = self.publishers[name]
-            result = await publisher.publish(formatted_message, image, image_mime_type)
-            return name, PublishResultItem(
+        results = await publish_all(selected, formatted_message, image, image_mime_type)
+        return {
+            name: PublishResultItem(
                 success=result.success,
                 post_uri=result.post_uri,
                 message_id=result.message_id,
                 error=result.error,
             )
-
-        tasks = [publish_to_target(name) for name in target_list]
-        results = await asyncio.gather(*tasks)
-        return dict(results)
+            for name, result in results.items()
+        }
 
     async def health_check_all(self) -> dict[str, bool]:
         """Check health of all publishers."""
@@ -188,29 +205,76 @@ def create_app(settings: Optional[Settings] = None) -> FastAPI:
 
         if request.image_data:
             try:
-                image_data = base64.b64decode(request.image_data)
-                image_mime_type = "image/png"
-            except Exception as e:
+                image_data = binascii.a2b_base64(request.image_data)
+            except (binascii.Error, ValueError) as e:
                 raise HTTPException(status_code=400, detail=f"Invalid base64 image data: {e}")
+            image_mime_type = sniff_mime_type(image_data) or DEFAULT_IMAGE_MIME_TYPE
 
         elif request.image_url:
             try:
-                async with httpx.AsyncClient(timeout=30.0) as client:
-                    response = await client.get(request.image_url)
-                    response.raise_for_status()
-                    image_data = response.content
+                response = await _manager.image_client.get(request.image_url)
+                response.raise_for_status()
+                image_data = response.content
+                image_mime_type = sniff_mime_type(image_data)
+                if image_mime_type is None:
                     content_type = response.headers.get("content-type", "image/png")
                     image_mime_type = content_type.split(";")[0]
             except Exception as e:
                 raise HTTPException(status_code=400, detail=f"Failed to fetch image: {e}")
 
-        # Publish to targets
+        return await dispatch(
+            request.message, image_data, image_mime_type, request.targets, request.metadata
+        )
+
+    @app.post("/publish/upload", response_model=PublishResponse)
+    async def publish_upload(
+        message: str = Form(..., description="The message text to publish"),
+        targets: Optional[list[str]] = Form(None, description="Target platforms"),
+        metadata: Optional[str] = Form(None, description="JSON-encoded metadata object"),
+        image: Optional[UploadFile] = File(None, description="Image to attach"),
+    ):
+        """Publish a message with an image sent as multipart/form-data.
+
+        Equivalent to /publish, but the image is uploaded as a raw file part
+        instead of base64-encoded JSON.
+        """
+        if _manager is None:
+            raise HTTPException(status_code=503, detail="Server not initialized")
+
+        parsed_metadata: Optional[dict[str, Any]] = None
+        if metadata:
+            try:
+                parsed_metadata = orjson.loads(metadata)
+            except ValueError as e:
+                raise HTTPException(status_code=400, detail=f"Invalid metadata JSON: {e}")
+            if not isinstance(parsed_metadata, dict):
+                raise HTTPException(status_code=400, detail="Metadata must be a JSON object")
+
+        image_data: Optional[bytes] = None
+        image_mime_type: Optional[str] = None
+        if image is not None:
+            image_data = await image.read()
+            # The bytes decide; the declared part type is only a fallback
+            image_mime_type = (
+                sniff_mime_type(image_data) or image.content_type or DEFAULT_IMAGE_MIME_TYPE
+            )
+
+        return await dispatch(message, image_data, image_mime_type, targets, parsed_metadata)
+
+    async def dispatch(
+        message: str,
+        image_data: Optional[bytes],
+        image_mime_type: Optional[str],
+        targets: Optional[list[str]],
+        metadata: Optional[dict[str, Any]],
+    ) -> PublishResponse:
+        """Publish to targets and build the endpoint response."""
         results = await _manager.publish(
-            message=request.message,
+            message=message,
             image=image_data,
             image_mime_type=image_mime_type,
-            targets=request.targets,
-            metadata=request.metadata,
+            targets=targets,
+            metadata=metadata,
         )
 
         if not results:
@@ -1,13 +1,18 @@
-"""Pytest configuration and fixtures."""
+"""Pytest configuration and fixtures.
+
+The configuration objects are frozen, so they are shared across the whole
+session. The app and its client are shared per module: a client runs the
+app lifespan once, and tests patch publisher methods rather than state.
+"""
+
+from dataclasses import replace
 
 import pytest
-from fastapi.testclient import TestClient
 
 from falcon_messenger.config import BlueskyConfig, DiscordConfig, Settings
-from falcon_messenger.server import create_app
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def bluesky_config():
     """Create a test Bluesky configuration."""
     return BlueskyConfig(
@@ -16,7 +21,7 @@ def bluesky_config():
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def discord_config():
     """Create a test Discord configuration."""
     return DiscordConfig(
@@ -24,59 +29,43 @@ def discord_config():
     )
 
 
-@pytest.fixture
-def settings(bluesky_config, discord_config):
+@pytest.fixture(scope="session")
+def settings_none():
+    """Create test settings with no publishers configured."""
+    return Settings(host="127.0.0.1", port=8080)
+
+
+@pytest.fixture(scope="session")
+def settings(settings_none, bluesky_config, discord_config):
     """Create test settings with both publishers configured."""
-    return Settings(
-        host="127.0.0.1",
-        port=8080,
-        debug=True,
-        bluesky=bluesky_config,
-        discord=discord_config,
-    )
+    return replace(settings_none, debug=True, bluesky=bluesky_config, discord=discord_config)
 
 
-@pytest.fixture
-def settings_bluesky_only(bluesky_config):
+@pytest.fixture(scope="session")
+def settings_bluesky_only(settings_none, bluesky_config):
     """Create test settings with only Bluesky configured."""
-    return Settings(
-        host="127.0.0.1",
-        port=8080,
-        bluesky=bluesky_config,
-        discord=DiscordConfig(),
-    )
+    return replace(settings_none, bluesky=bluesky_config)
 
 
-@pytest.fixture
-def settings_discord_only(discord_config):
+@pytest.fixture(scope="session")
+def settings_discord_only(settings_none, discord_config):
     """Create test settings with only Discord configured."""
-    return Settings(
-        host="127.0.0.1",
-        port=8080,
-        bluesky=BlueskyConfig(),
-        discord=discord_config,
-    )
-
-
-@pytest.fixture
-def settings_none():
-    """Create test settings with no publishers configured."""
-    return Settings(
-        host="127.0.0.1",
-        port=8080,
-        bluesky=BlueskyConfig(),
-        discord=DiscordConfig(),
-    )
+    return replace(settings_none, discord=discord_config)
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def app(settings):
     """Create a test FastAPI application."""
+    # Imported here so test modules that never use the app don't load FastAPI
+    from falcon_messenger.server import create_app
+
     return create_app(settings)
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def client(app):
     """Create a test client for the FastAPI application."""
+    from fastapi.testclient import TestClient
+
     with TestClient(app) as client:
         yield client
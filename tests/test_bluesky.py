@@ -1,13 +1,21 @@
 """Tests for the Bluesky publisher."""
 
+from dataclasses import replace
+from types import SimpleNamespace
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
+from atproto import SessionEvent
 
 from falcon_messenger.config import BlueskyConfig
 from falcon_messenger.publishers.bluesky import BlueskyPublisher
 
 
+async def network_error(*args, **kwargs):
+    """Stand in for a client call that fails."""
+    raise Exception("Network error")
+
+
 @pytest.fixture
 def publisher(bluesky_config):
     """Create a Bluesky publisher instance."""
@@ -24,35 +32,32 @@ class TestBlueskyPublisher:
     @pytest.mark.asyncio
     async def test_publish_text_only(self, publisher):
         """Test publishing a text-only post."""
-        mock_response = MagicMock()
-        mock_response.uri = "at://did:plc:test/app.bsky.feed.post/123"
+        mock_response = SimpleNamespace(uri="at://did:plc:test/app.bsky.feed.post/123")
 
-        with patch.object(publisher, "_client", new_callable=MagicMock) as mock_client:
-            mock_client.login = AsyncMock()
-            mock_client.send_post = AsyncMock(return_value=mock_response)
-            publisher._authenticated = True
+        # The fixture builds a fresh publisher per test, so no restore is needed
+        mock_client = SimpleNamespace(send_post=AsyncMock(return_value=mock_response))
+        publisher._client = mock_client
+        publisher._authenticated = True
 
-            result = await publisher.publish("Hello, Bluesky!")
+        result = await publisher.publish("Hello, Bluesky!")
 
-            assert result.success is True
-            assert result.post_uri == "at://did:plc:test/app.bsky.feed.post/123"
-            mock_client.send_post.assert_called_once()
+        assert result.success is True
+        assert result.post_uri == "at://did:plc:test/app.bsky.feed.post/123"
+        mock_client.send_post.assert_called_once()
 
     @pytest.mark.asyncio
     async def test_publish_with_image(self, publisher):
         """Test publishing a post with an image."""
-        mock_response = MagicMock()
-        mock_response.uri = "at://did:plc:test/app.bsky.feed.post/123"
-
-        mock_blob_response = MagicMock()
-        mock_blob_response.blob = MagicMock()
+        mock_response = SimpleNamespace(uri="at://did:plc:test/app.bsky.feed.post/123")
+        mock_blob_response = SimpleNamespace(blob=object())
 
-        with patch.object(publisher, "_ensure_authenticated", new_callable=AsyncMock) as mock_auth, \
+        with patch.object(BlueskyPublisher, "_ensure_authenticated") as mock_auth, \
              patch("falcon_messenger.publishers.bluesky.ImagesEmbed") as mock_embed, \
              patch("falcon_messenger.publishers.bluesky.Image") as mock_image:
-            mock_client = MagicMock()
-            mock_client.upload_blob = AsyncMock(return_value=mock_blob_response)
-            mock_client.send_post = AsyncMock(return_value=mock_response)
+            mock_client = SimpleNamespace(
+                upload_blob=AsyncMock(return_value=mock_blob_response),
+                send_post=AsyncMock(return_value=mock_response),
+            )
             mock_auth.return_value = mock_client
 
             image_data = b"fake image data"
@@ -67,9 +72,8 @@ class TestBlueskyPublisher:
     @pytest.mark.asyncio
     async def test_publish_failure(self, publisher):
         """Test handling of publish failure."""
-        with patch.object(publisher, "_ensure_authenticated", new_callable=AsyncMock) as mock_auth:
-            mock_client = MagicMock()
-            mock_client.send_post = AsyncMock(side_effect=Exception("Network error"))
+        with patch.object(BlueskyPublisher, "_ensure_authenticated") as mock_auth:
+            mock_client = SimpleNamespace(send_post=network_error)
             mock_auth.return_value = mock_client
 
             result = await publisher.publish("Test message")
@@ -80,21 +84,82 @@ class TestBlueskyPublisher:
     @pytest.mark.asyncio
     async def test_health_check_success(self, publisher):
         """Test successful health check."""
-        mock_profile = MagicMock()
+        mock_session = MagicMock()
 
-        with patch.object(publisher, "_ensure_authenticated", new_callable=AsyncMock) as mock_auth:
+        with patch.object(BlueskyPublisher, "_ensure_authenticated") as mock_auth:
             mock_client = MagicMock()
-            mock_client.get_profile = AsyncMock(return_value=mock_profile)
+            mock_client.com.atproto.server.get_session = AsyncMock(return_value=mock_session)
             mock_auth.return_value = mock_client
 
             result = await publisher.health_check()
             assert result is True
 
+    @pytest.mark.asyncio
+    async def test_health_check_is_cached(self, publisher):
+        """Test that a successful health check is reused within the TTL."""
+        with patch.object(BlueskyPublisher, "_ensure_authenticated") as mock_auth:
+            mock_client = MagicMock()
+            mock_client.com.atproto.server.get_session = AsyncMock(return_value=MagicMock())
+            mock_auth.return_value = mock_client
+
+            assert await publisher.health_check() is True
+            assert await publisher.health_check() is True
+            mock_client.com.atproto.server.get_session.assert_awaited_once()
+
     @pytest.mark.asyncio
     async def test_health_check_failure(self, publisher):
         """Test failed health check."""
-        with patch.object(publisher, "_ensure_authenticated", new_callable=AsyncMock) as mock_auth:
+        with patch.object(BlueskyPublisher, "_ensure_authenticated") as mock_auth:
             mock_auth.side_effect = Exception("Connection failed")
 
             result = await publisher.health_check()
             assert result is False
+
+
+class TestBlueskySessionPersistence:
+    """Tests for resuming Bluesky sessions from the session file."""
+
+    @pytest.mark.asyncio
+    async def test_resumes_saved_session(self, bluesky_config, tmp_path):
+        """Test that a saved session string is used instead of the password."""
+        session_file = tmp_path / "session.txt"
+        session_file.write_text("saved-session")
+        publisher = BlueskyPublisher(replace(bluesky_config, session_file=str(session_file)))
+
+        with patch("falcon_messenger.publishers.bluesky.AsyncClient") as mock_client_cls:
+            mock_client = mock_client_cls.return_value
+            mock_client.login = AsyncMock()
+
+            await publisher._ensure_authenticated()
+
+            mock_client.login.assert_awaited_once_with(session_string="saved-session")
+
+    @pytest.mark.asyncio
+    async def test_falls_back_to_password_login(self, bluesky_config, tmp_path):
+        """Test that a rejected session falls back to password login."""
+        session_file = tmp_path / "session.txt"
+        session_file.write_text("expired-session")
+        publisher = BlueskyPublisher(replace(bluesky_config, session_file=str(session_file)))
+
+        with patch("falcon_messenger.publishers.bluesky.AsyncClient") as mock_client_cls:
+            mock_client = mock_client_cls.return_value
+            mock_client.login = AsyncMock(side_effect=[Exception("Token expired"), None])
+
+            await publisher._ensure_authenticated()
+
+            mock_client.login.assert_awaited_with(
+                bluesky_config.handle, bluesky_config.app_password
+            )
+
+    @pytest.mark.asyncio
+    async def test_saves_session_privately(self, bluesky_config, tmp_path):
+        """Test that created sessions are written to the session file."""
+        session_file = tmp_path / "session.txt"
+        publisher = BlueskyPublisher(replace(bluesky_config, session_file=str(session_file)))
+        session = MagicMock()
+        session.encode.return_value = "new-session"
+
+        await publisher._save_session(SessionEvent.CREATE, session)
+
+        assert session_file.read_text() == "new-session"
+        assert session_file.stat().st_mode & 0o777 == 0o600
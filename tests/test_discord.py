@@ -1,5 +1,8 @@
 """Tests for the Discord publisher."""
 
+from dataclasses import replace
+from types import SimpleNamespace
+from typing import Optional
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import httpx
@@ -9,6 +12,16 @@ from falcon_messenger.config import DiscordConfig
 from falcon_messenger.publishers.discord import DiscordPublisher
 
 
+def ok_response(body: Optional[dict] = None) -> SimpleNamespace:
+    """Create a stub for a successful webhook response."""
+    return SimpleNamespace(status_code=200, json=lambda: body, raise_for_status=lambda: None)
+
+
+async def connection_failed(*args, **kwargs):
+    """Stand in for a client call that fails."""
+    raise Exception("Connection failed")
+
+
 @pytest.fixture
 def publisher(discord_config):
     """Create a Discord publisher instance."""
@@ -25,14 +38,10 @@ class TestDiscordPublisher:
     @pytest.mark.asyncio
     async def test_publish_text_only(self, publisher):
         """Test publishing a text-only message."""
-        mock_response = MagicMock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {"id": "123456789"}
-        mock_response.raise_for_status = MagicMock()
+        mock_response = ok_response({"id": "123456789"})
 
-        with patch.object(publisher, "_get_client", new_callable=AsyncMock) as mock_get_client:
-            mock_client = MagicMock()
-            mock_client.post = AsyncMock(return_value=mock_response)
+        with patch.object(DiscordPublisher, "_get_client") as mock_get_client:
+            mock_client = SimpleNamespace(post=AsyncMock(return_value=mock_response))
             mock_get_client.return_value = mock_client
 
             result = await publisher.publish("Hello, Discord!")
@@ -40,18 +49,34 @@ class TestDiscordPublisher:
             assert result.success is True
             assert result.message_id == "123456789"
             mock_client.post.assert_called_once()
+            assert mock_client.post.call_args.kwargs["content"] == b'{"content":"Hello, Discord!"}'
+
+    @pytest.mark.asyncio
+    async def test_publish_without_wait(self, discord_config):
+        """Test that disabling wait skips ?wait=true and the response body."""
+        publisher = DiscordPublisher(replace(discord_config, wait=False))
+        mock_response = MagicMock()
+        mock_response.status_code = 204
+        mock_response.raise_for_status = lambda: None
+
+        with patch.object(DiscordPublisher, "_get_client") as mock_get_client:
+            mock_client = SimpleNamespace(post=AsyncMock(return_value=mock_response))
+            mock_get_client.return_value = mock_client
+
+            result = await publisher.publish("Hello, Discord!")
+
+            assert result.success is True
+            assert result.message_id is None
+            assert mock_client.post.call_args.args[0] == discord_config.webhook_url
+            mock_response.json.assert_not_called()
 
     @pytest.mark.asyncio
     async def test_publish_with_image(self, publisher):
         """Test publishing a message with an image."""
-        mock_response = MagicMock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {"id": "123456789"}
-        mock_response.raise_for_status = MagicMock()
+        mock_response = ok_response({"id": "123456789"})
 
-        with patch.object(publisher, "_get_client", new_callable=AsyncMock) as mock_get_client:
-            mock_client = MagicMock()
-            mock_client.post = AsyncMock(return_value=mock_response)
+        with patch.object(DiscordPublisher, "_get_client") as mock_get_client:
+            mock_client = SimpleNamespace(post=AsyncMock(return_value=mock_response))
             mock_get_client.return_value = mock_client
 
             image_data = b"fake image data"
@@ -61,20 +86,32 @@ class TestDiscordPublisher:
             call_args = mock_client.post.call_args
             assert "files" in call_args.kwargs
 
+    @pytest.mark.asyncio
+    async def test_publish_image_type_sniffed(self, publisher):
+        """Test that the attachment type comes from the image bytes."""
+        mock_response = ok_response({"id": "123456789"})
+
+        with patch.object(DiscordPublisher, "_get_client") as mock_get_client:
+            mock_client = SimpleNamespace(post=AsyncMock(return_value=mock_response))
+            mock_get_client.return_value = mock_client
+
+            image_data = b"\xff\xd8\xff\xe0fake jpeg data"
+            await publisher.publish("Post with image", image_data, "image/png")
+
+            filename, _, mime_type = mock_client.post.call_args.kwargs["files"]["file"]
+            assert filename == "image.jpg"
+            assert mime_type == "image/jpeg"
+
     @pytest.mark.asyncio
     async def test_publish_failure_http_error(self, publisher):
         """Test handling of HTTP error during publish."""
-        mock_response = MagicMock()
-        mock_response.status_code = 401
-        mock_response.raise_for_status = MagicMock(
-            side_effect=httpx.HTTPStatusError(
-                "Unauthorized", request=MagicMock(), response=mock_response
-            )
+        # A real response, so raise_for_status raises the genuine error
+        mock_response = httpx.Response(
+            401, request=httpx.Request("POST", publisher.config.webhook_url)
         )
 
-        with patch.object(publisher, "_get_client", new_callable=AsyncMock) as mock_get_client:
-            mock_client = MagicMock()
-            mock_client.post = AsyncMock(return_value=mock_response)
+        with patch.object(DiscordPublisher, "_get_client") as mock_get_client:
+            mock_client = SimpleNamespace(post=AsyncMock(return_value=mock_response))
             mock_get_client.return_value = mock_client
 
             result = await publisher.publish("Test message")
@@ -85,12 +122,10 @@ class TestDiscordPublisher:
     @pytest.mark.asyncio
     async def test_health_check_success(self, publisher):
         """Test successful health check."""
-        mock_response = MagicMock()
-        mock_response.status_code = 200
+        mock_response = ok_response()
 
-        with patch.object(publisher, "_get_client", new_callable=AsyncMock) as mock_get_client:
-            mock_client = MagicMock()
-            mock_client.get = AsyncMock(return_value=mock_response)
+        with patch.object(DiscordPublisher, "_get_client") as mock_get_client:
+            mock_client = SimpleNamespace(get=AsyncMock(return_value=mock_response))
             mock_get_client.return_value = mock_client
 
             result = await publisher.health_check()
@@ -99,9 +134,8 @@ class TestDiscordPublisher:
     @pytest.mark.asyncio
     async def test_health_check_failure(self, publisher):
         """Test failed health check."""
-        with patch.object(publisher, "_get_client", new_callable=AsyncMock) as mock_get_client:
-            mock_client = MagicMock()
-            mock_client.get = AsyncMock(side_effect=Exception("Connection failed"))
+        with patch.object(DiscordPublisher, "_get_client") as mock_get_client:
+            mock_client = SimpleNamespace(get=connection_failed)
             mock_get_client.return_value = mock_client
 
             result = await publisher.health_check()
@@ -110,8 +144,7 @@ class TestDiscordPublisher:
     @pytest.mark.asyncio
     async def test_close(self, publisher):
         """Test closing the publisher cleans up resources."""
-        mock_client = MagicMock()
-        mock_client.aclose = AsyncMock()
+        mock_client = SimpleNamespace(aclose=AsyncMock())
         publisher._client = mock_client
 
         await publisher.close()
@@ -0,0 +1,135 @@
+"""Tests for message formatters."""
+
+from unittest.mock import patch
+
+import pytest
+
+from falcon_messenger.formatters import BaseFormatter, SuperSignalFormatter
+from falcon_messenger.formatters.super_signal import _format_alert, format_stock_alert
+
+
+@pytest.fixture
+def formatter():
+    """Create a super-signal formatter instance."""
+    return SuperSignalFormatter()
+
+
+class TestBaseFormatter:
+    """Tests for BaseFormatter."""
+
+    def test_subclass_requires_source(self):
+        """Test that a concrete formatter without a source fails at definition."""
+        with pytest.raises(TypeError, match="source"):
+
+            class NoSourceFormatter(BaseFormatter):
+                def format(self, message, metadata=None):
+                    return message
+
+
+class TestSuperSignalFormatter:
+    """Tests for SuperSignalFormatter."""
+
+    def test_can_handle(self, formatter):
+        """Test that only super-signal metadata is handled."""
+        assert formatter.can_handle({"source": "super-signal"}) is True
+        assert formatter.can_handle({"source": "other"}) is False
+        assert formatter.can_handle({}) is False
+        assert formatter.can_handle(None) is False
+
+    def test_format_without_metadata(self, formatter):
+        """Test that messages pass through unchanged without metadata."""
+        assert formatter.format("Hello") == "Hello"
+
+    def test_format_full_alert(self, formatter):
+        """Test formatting an alert with every optional field present."""
+        result = formatter.format(
+            "Watch the open",
+            {
+                "source": "super-signal",
+                "ticker": "AAPL",
+                "risk_count": 3,
+                "risk_flags": ["High volatility", "Insider selling", "Volume spike"],
+                "price": 178.5,
+            },
+        )
+        assert result == (
+            "\U0001F6A8 $AAPL Alert\n"
+            "\n"
+            "Price: $178.50\n"
+            "Risk flags: 3\n"
+            "\n"
+            "• High volatility\n"
+            "• Insider selling\n"
+            "• Volume spike\n"
+            "\n"
+            "Watch the open\n"
+            "\n"
+            "#AAPL #stocks #trading"
+        )
+
+    def test_format_minimal_alert(self, formatter):
+        """Test formatting with no ticker or optional fields."""
+        result = formatter.format("Something happened", {"source": "super-signal"})
+        assert result == "\U0001F4CA Stock Alert\n"
+
+    def test_format_signal_type(self, formatter):
+        """Test the header suffix for signals and the warning emoji."""
+        metadata = {
+            "source": "super-signal",
+            "ticker": "TSLA",
+            "risk_count": 1,
+            "signal_type": "signal",
+        }
+        result = formatter.format("", metadata)
+        assert result == (
+            "⚠️ $TSLA Signal\n"
+            "\n"
+            "Risk flags: 1\n"
+            "\n"
+            "#TSLA #stocks #trading"
+        )
+
+    def test_format_skips_default_message(self, formatter):
+        """Test that the default '$TICKER alert' message is not repeated."""
+        result = formatter.format("$aapl ALERT", {"source": "super-signal", "ticker": "AAPL"})
+        assert "$aapl ALERT" not in result
+
+    def test_format_keeps_same_length_message(self, formatter):
+        """Test that a message as long as the default but different is kept."""
+        result = formatter.format("$AAPL moves", {"source": "super-signal", "ticker": "AAPL"})
+        assert "\n\n$AAPL moves\n\n" in result
+
+    def test_format_non_string_ticker(self, formatter):
+        """Test that a numeric ticker from JSON metadata is formatted as text."""
+        result = formatter.format("Breakout", {"source": "super-signal", "ticker": 123})
+        assert result.startswith("📊 $123 Alert\n")
+        assert "\n\nBreakout\n\n#123 #stocks #trading" in result
+
+    def test_format_limits_risk_flags(self, formatter):
+        """Test that at most five risk flags are listed."""
+        flags = [f"flag {i}" for i in range(8)]
+        result = formatter.format(
+            "", {"source": "super-signal", "ticker": "AAPL", "risk_flags": flags}
+        )
+        assert "• flag 4" in result
+        assert "• flag 5" not in result
+
+    def test_format_unhashable_metadata(self, formatter):
+        """Test that metadata which cannot be cached is still formatted."""
+        result = formatter.format(
+            "", {"source": "super-signal", "ticker": "AAPL", "risk_flags": [["nested"]]}
+        )
+        assert "• ['nested']" in result
+
+    def test_format_error_propagates(self, formatter):
+        """Test that formatting errors are raised rather than retried uncached."""
+        with patch.object(_format_alert, "__wrapped__", side_effect=AssertionError), \
+             pytest.raises(TypeError):
+            formatter.format("", {"source": "super-signal", "risk_count": "3"})
+
+
+def test_format_stock_alert():
+    """Test the format_stock_alert convenience function."""
+    result = format_stock_alert("NVDA", risk_flags=["Gap up"], price=100.0)
+    assert result.startswith("⚠️ $NVDA Alert\n\nPrice: $100.00\nRisk flags: 1\n")
+    assert result.endswith("#NVDA #stocks #trading")
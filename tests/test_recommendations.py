@@ -0,0 +1,384 @@
+"""Tests for the recommendations fetcher, checker and formatters."""
+
+import sqlite3
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import httpx
+import pytest
+
+from falcon_messenger.config import FalconEndpointConfig
+from falcon_messenger.recommendations import (
+    FinvizChecker,
+    PostedTickersTracker,
+    RecommendationsFetcher,
+    RecommendationsScheduler,
+    TokenBucket,
+    format_recommendations_table,
+    format_single_recommendation,
+)
+
+FINVIZ_HTML = (
+    b"<table><tr>"
+    b'<td class="snapshot-td2">Rel Volume</td><td class="snapshot-td2"><b>2.35</b></td>'
+    b'<td class="snapshot-td2">Volume</td><td class="snapshot-td2"><b>1,234,567</b></td>'
+    b"</tr></table>"
+)
+
+
+@pytest.fixture
+def finviz():
+    """Create a Finviz checker instance."""
+    return FinvizChecker()
+
+
+@pytest.fixture
+def tracker(tmp_path):
+    """Create a posted-tickers tracker backed by a temporary database."""
+    tracker = PostedTickersTracker(tmp_path / "posted.db")
+    yield tracker
+    tracker.close()
+
+
+@pytest.fixture
+def scheduler():
+    """Create a scheduler with Finviz checks and tracking disabled."""
+    fetcher = RecommendationsFetcher(FalconEndpointConfig(endpoint_url="https://falcon.test/api"))
+    return RecommendationsScheduler(
+        fetcher,
+        "https://discord.com/api/webhooks/123456/test-token",
+        check_finviz=False,
+        track_posted=False,
+    )
+
+
+def mock_finviz_client(content: bytes) -> httpx.AsyncClient:
+    """Create an HTTP client that serves the given page for every request."""
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, content=content)
+
+    return httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+
+class TestFinvizChecker:
+    """Tests for FinvizChecker."""
+
+    @pytest.mark.asyncio
+    async def test_get_metrics(self, finviz):
+        """Test parsing RVOL and volume from a quote page."""
+        with patch.object(FinvizChecker, "_get_client") as mock_get_client:
+            mock_get_client.return_value = mock_finviz_client(FINVIZ_HTML)
+
+            metrics = await finviz.get_metrics("AAPL")
+
+            assert metrics == {"rvol": 2.35, "volume": 1_234_567}
+
+    @pytest.mark.asyncio
+    async def test_get_metrics_stops_reading_once_found(self, finviz):
+        """Test that the rest of the page is not read once both values are found."""
+        chunks = [FINVIZ_HTML[:40], FINVIZ_HTML[40:], b"<p>rest of page</p>" * 100]
+        seen = []
+
+        async def page():
+            for chunk in chunks:
+                seen.append(chunk)
+                yield chunk
+
+        client = httpx.AsyncClient(
+            transport=httpx.MockTransport(lambda request: httpx.Response(200, content=page()))
+        )
+        with patch.object(FinvizChecker, "_get_client", return_value=client):
+            metrics = await finviz.get_metrics("AAPL")
+
+        assert metrics == {"rvol": 2.35, "volume": 1_234_567}
+        assert len(seen) == 2
+
+    @pytest.mark.asyncio
+    async def test_get_metrics_byte_by_byte(self, finviz):
+        """Test that values split across chunk boundaries are still parsed."""
+
+        async def page():
+            for i in range(len(FINVIZ_HTML)):
+                yield FINVIZ_HTML[i:i + 1]
+
+        client = httpx.AsyncClient(
+            transport=httpx.MockTransport(lambda request: httpx.Response(200, content=page()))
+        )
+        with patch.object(FinvizChecker, "_get_client", return_value=client):
+            metrics = await finviz.get_metrics("AAPL")
+
+        assert metrics == {"rvol": 2.35, "volume": 1_234_567}
+
+    @pytest.mark.asyncio
+    async def test_get_metrics_many_fetches_duplicates_once(self, finviz):
+        """Test that a ticker listed twice is looked up only once."""
+        metrics = {"rvol": 2.35, "volume": 1_234_567}
+        with patch.object(FinvizChecker, "get_metrics", return_value=metrics) as mock_get:
+            results = await finviz.get_metrics_many(["AAPL", "MSFT", "AAPL"])
+
+        assert results == [metrics, metrics, metrics]
+        assert mock_get.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_get_metrics_not_found(self, finviz):
+        """Test that a page without metrics returns None."""
+        with patch.object(FinvizChecker, "_get_client") as mock_get_client:
+            mock_get_client.return_value = mock_finviz_client(b"<html></html>")
+
+            assert await finviz.get_metrics("AAPL") is None
+
+    @pytest.mark.asyncio
+    async def test_get_metrics_error(self, finviz):
+        """Test that request errors return None."""
+        with patch.object(FinvizChecker, "_get_client") as mock_get_client:
+            mock_get_client.side_effect = Exception("Network error")
+
+            assert await finviz.get_metrics("AAPL") is None
+
+
+class TestPostedTickersTracker:
+    """Tests for PostedTickersTracker."""
+
+    def test_mark_posted(self, tracker):
+        """Test that marked tickers are reported as posted, case-insensitively."""
+        assert tracker.is_posted("AAPL") is False
+
+        tracker.mark_posted("aapl", rvol=2.5, theme="AI", sector="Tech")
+
+        assert tracker.is_posted("AAPL") is True
+        assert tracker.load_posted_set() == {"AAPL"}
+        [record] = tracker.get_posted_tickers()
+        assert record["ticker"] == "AAPL"
+        assert record["rvol"] == 2.5
+
+    def test_mark_posted_many(self, tracker):
+        """Test recording several posted tickers at once."""
+        tracker.mark_posted_many([("aapl", 2.5, "AI", "Tech"), ("MSFT", None, None, None)])
+
+        assert tracker.load_posted_set() == {"AAPL", "MSFT"}
+
+    def test_migrates_rowid_table(self, tmp_path):
+        """Test that a table from older versions is rebuilt without rowids."""
+        db_file = tmp_path / "posted.db"
+        conn = sqlite3.connect(db_file)
+        conn.execute(
+            "CREATE TABLE posted_tickers (ticker TEXT PRIMARY KEY, "
+            "posted_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP, rvol REAL, theme TEXT, sector TEXT)"
+        )
+        conn.execute("INSERT INTO posted_tickers (ticker, rvol) VALUES ('AAPL', 2.5)")
+        conn.commit()
+        conn.close()
+
+        tracker = PostedTickersTracker(db_file)
+        try:
+            sql = tracker._get_conn().execute(
+                "SELECT sql FROM sqlite_master WHERE name = 'posted_tickers'"
+            ).fetchone()[0]
+            assert "WITHOUT ROWID" in sql
+            assert tracker.is_posted("AAPL") is True
+        finally:
+            tracker.close()
+
+    def test_clear_before_date_uses_index(self, tracker):
+        """Test that date-bounded clears use the posted_at index."""
+        plan = tracker._get_conn().execute(
+            "EXPLAIN QUERY PLAN DELETE FROM posted_tickers WHERE posted_at < ?", ("2024-01-01",)
+        ).fetchall()
+        assert any("idx_posted_at" in row[-1] for row in plan)
+
+    def test_uses_wal(self, tracker):
+        """Test that the tracker database runs in WAL mode."""
+        journal_mode = tracker._get_conn().execute("PRAGMA journal_mode").fetchone()[0]
+        assert journal_mode == "wal"
+
+    def test_clear(self, tracker):
+        """Test clearing all posted tickers."""
+        tracker.mark_posted("AAPL")
+        tracker.mark_posted("MSFT")
+
+        assert tracker.clear() == 2
+        assert tracker.get_posted_tickers() == []
+
+
+class TestFormatSingleRecommendation:
+    """Tests for format_single_recommendation."""
+
+    def test_metrics_line(self):
+        """Test that RVOL and volume are shown with their markers."""
+        message = format_single_recommendation({"ticker": "AAPL"}, rvol=2.5, volume=500)
+        assert "\N{FIRE} RVOL: 2.50 | \N{CHART WITH DOWNWARDS TREND} Vol: 500" in message
+
+
+class TestFormatRecommendationsTable:
+    """Tests for format_recommendations_table."""
+
+    @pytest.fixture(autouse=True)
+    def fixed_time(self):
+        """Pin the timestamp shown in the table header."""
+        with patch("falcon_messenger.recommendations.datetime") as mock_datetime:
+            mock_datetime.now.return_value.strftime.return_value = "2024-01-02 09:30:00"
+            yield
+
+    def test_empty(self):
+        """Test formatting with no recommendations."""
+        assert format_recommendations_table([]) == "No recommendations available."
+
+    def test_table(self):
+        """Test column order, padding and truncation of long values."""
+        items = [
+            {"reasoning": "x" * 30, "ticker": "AAPL", "extra": 1},
+            {"reasoning": "short", "ticker": "NVDA", "extra": None},
+        ]
+        assert format_recommendations_table(items) == (
+            "**Falcon Recommendations** (2024-01-02 09:30:00)\n"
+            "```\n"
+            "ticker | reasoning                 | extra\n"
+            "-------+---------------------------+------\n"
+            "AAPL   | xxxxxxxxxxxxxxxxxxxxxxx.. | 1    \n"
+            "NVDA   | short                     | None \n"
+            "```"
+        )
+
+    def test_truncates_rows_to_max_length(self):
+        """Test that rows beyond the length limit are summarized."""
+        items = [{"ticker": f"T{i:03d}"} for i in range(20)]
+        result = format_recommendations_table(items, max_length=100)
+        assert result.splitlines()[-2] == "... and 16 more"
+        assert len(result) - len("\n... and 16 more") <= 100
+
+
+class TestRecommendationsFetcher:
+    """Tests for RecommendationsFetcher."""
+
+    @pytest.mark.asyncio
+    async def test_fetch(self):
+        """Test decoding the endpoint's JSON response."""
+        fetcher = RecommendationsFetcher(FalconEndpointConfig(endpoint_url="https://falcon.test/api"))
+        response = MagicMock()
+        response.content = b'[{"ticker": "AAPL"}]'
+
+        with patch.object(RecommendationsFetcher, "_get_client") as mock_get_client:
+            mock_get_client.return_value.get = AsyncMock(return_value=response)
+
+            assert await fetcher.fetch() == [{"ticker": "AAPL"}]
+
+
+class TestTokenBucket:
+    """Tests for TokenBucket."""
+
+    @pytest.mark.asyncio
+    async def test_burst_then_wait(self):
+        """Test that a full bucket allows a burst and then paces acquisitions."""
+        bucket = TokenBucket(rate=2, per=1.0)
+
+        with patch("falcon_messenger.recommendations.asyncio.sleep") as mock_sleep:
+            await bucket.acquire()
+            await bucket.acquire()
+            mock_sleep.assert_not_called()
+
+            async def fake_sleep(delay):
+                bucket._updated -= delay  # Let the sleep's time pass
+
+            mock_sleep.side_effect = fake_sleep
+            await bucket.acquire()
+
+            mock_sleep.assert_awaited_once()
+            assert mock_sleep.await_args.args[0] == pytest.approx(0.5, abs=0.01)
+
+
+class TestRecommendationsScheduler:
+    """Tests for RecommendationsScheduler."""
+
+    @pytest.mark.asyncio
+    async def test_post_items(self, scheduler):
+        """Test that passing items are posted once per ticker."""
+        items = [{"ticker": "AAPL"}, {"ticker": ""}, {"ticker": "MSFT"}, {"ticker": "aapl"}]
+
+        with patch.object(RecommendationsScheduler, "_post_to_discord") as mock_post, \
+             patch("falcon_messenger.recommendations.asyncio.sleep"):
+            mock_post.return_value = True
+
+            assert await scheduler._post_items(items) == 2
+            assert mock_post.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_post_items_skips_missing_tickers(self, scheduler):
+        """Test that null or non-string tickers are skipped without failing the batch."""
+        items = [{"ticker": None}, {"ticker": "AAPL"}, {"ticker": 123}, {}]
+
+        with patch.object(RecommendationsScheduler, "_post_to_discord") as mock_post:
+            mock_post.return_value = True
+
+            assert await scheduler._post_items(items) == 1
+
+    @pytest.mark.asyncio
+    async def test_post_items_skips_posted(self, scheduler, tracker):
+        """Test that tickers already in the tracker are not posted again."""
+        tracker.mark_posted("AAPL")
+        scheduler._tracker = tracker
+
+        with patch.object(RecommendationsScheduler, "_post_to_discord") as mock_post, \
+             patch("falcon_messenger.recommendations.asyncio.sleep"):
+            mock_post.return_value = True
+
+            assert await scheduler._post_items([{"ticker": "AAPL"}, {"ticker": "MSFT"}]) == 1
+            assert tracker.load_posted_set() == {"AAPL", "MSFT"}
+
+    @pytest.mark.asyncio
+    async def test_should_post_skips_batch_duplicates(self, scheduler):
+        """Test that a repeated ticker in one batch is rejected before any lookup."""
+        seen = set()
+
+        assert await scheduler._should_post({"ticker": "AAPL"}, set(), seen) == (True, None)
+        assert await scheduler._should_post({"ticker": "aapl"}, set(), seen) == (False, None)
+
+    @pytest.mark.asyncio
+    async def test_post_to_discord_retries_after_rate_limit(self, scheduler):
+        """Test that a 429 response is retried after its Retry-After delay."""
+        request = httpx.Request("POST", scheduler._discord_post_url)
+        responses = [
+            httpx.Response(429, headers={"Retry-After": "1.5"}, request=request),
+            httpx.Response(200, json={"id": "1"}, request=request),
+        ]
+
+        client = await scheduler._get_client()
+        with patch.object(client, "post", AsyncMock(side_effect=responses)), \
+             patch("falcon_messenger.recommendations.asyncio.sleep") as mock_sleep:
+            assert await scheduler._post_to_discord("hello") is True
+
+            mock_sleep.assert_awaited_once()
+            assert mock_sleep.await_args.args[0] == pytest.approx(1.5, abs=0.05)
+
+    @pytest.mark.asyncio
+    async def test_stop_resets_client(self, scheduler):
+        """Test that a stopped scheduler opens a new client when used again."""
+        client = await scheduler._get_client()
+        await scheduler.stop()
+
+        assert client.is_closed
+        new_client = await scheduler._get_client()
+        assert new_client is not client
+        assert not new_client.is_closed
+        await new_client.aclose()
+
+    @pytest.mark.asyncio
+    async def test_should_post_prefilters(self, scheduler):
+        """Test that excluded risk levels are rejected before any lookup."""
+        scheduler.excluded_risk_levels = frozenset({"high"})
+
+        assert await scheduler._should_post(
+            {"ticker": "AAPL", "risk_level": "High"}, set()
+        ) == (False, None)
+
+    @pytest.mark.asyncio
+    async def test_should_post_any_symbol_without_finviz(self, scheduler):
+        """Test that symbols Finviz can't quote still post when Finviz checks are off."""
+        assert await scheduler._should_post({"ticker": "BTC-USD"}, set()) == (True, None)
+
+    @pytest.mark.asyncio
+    async def test_should_post_skips_finviz_for_non_exchange_symbols(self, scheduler):
+        """Test that symbols Finviz can't quote are rejected without a lookup."""
+        scheduler._finviz = MagicMock()
+
+        assert await scheduler._should_post({"ticker": "BTC-USD"}, set()) == (False, None)
+        scheduler._finviz.get_metrics.assert_not_called()
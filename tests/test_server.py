@@ -1,28 +1,46 @@
 """Tests for the FastAPI server."""
 
-from unittest.mock import AsyncMock, patch
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 from fastapi.testclient import TestClient
 
+from falcon_messenger.publishers import BlueskyPublisher, DiscordPublisher
 from falcon_messenger.publishers.base import PublishResult
 from falcon_messenger.server import create_app
 
+# Publish results are frozen, so one instance of each serves every test
+BLUESKY_OK = PublishResult(success=True, post_uri="at://test/post/123")
+BLUESKY_FAILED = PublishResult(success=False, error="Auth failed")
+DISCORD_OK = PublishResult(success=True, message_id="456")
+
+
+@pytest.fixture(scope="module")
+def publish_mocks():
+    """Patch both publishers' publish methods once for the whole module."""
+    with patch.object(BlueskyPublisher, "publish", new_callable=AsyncMock) as bluesky, \
+         patch.object(DiscordPublisher, "publish", new_callable=AsyncMock) as discord:
+        yield SimpleNamespace(bluesky=bluesky, discord=discord)
+
+
+@pytest.fixture(autouse=True)
+def mock_publish(publish_mocks):
+    """Reset the publish mocks to successful results before each test."""
+    publish_mocks.bluesky.reset_mock(return_value=True, side_effect=True)
+    publish_mocks.discord.reset_mock(return_value=True, side_effect=True)
+    publish_mocks.bluesky.return_value = BLUESKY_OK
+    publish_mocks.discord.return_value = DISCORD_OK
+    return publish_mocks
+
 
 class TestHealthEndpoint:
     """Tests for the /health endpoint."""
 
     def test_health_returns_ok(self, client):
         """Test that health endpoint returns OK status."""
-        with patch(
-            "falcon_messenger.publishers.bluesky.BlueskyPublisher.health_check",
-            new_callable=AsyncMock,
-            return_value=True,
-        ), patch(
-            "falcon_messenger.publishers.discord.DiscordPublisher.health_check",
-            new_callable=AsyncMock,
-            return_value=True,
-        ):
+        with patch.object(BlueskyPublisher, "health_check", AsyncMock(return_value=True)), \
+             patch.object(DiscordPublisher, "health_check", AsyncMock(return_value=True)):
             response = client.get("/health")
             assert response.status_code == 200
             data = response.json()
@@ -46,14 +64,15 @@ class TestConfigEndpoint:
 
     def test_config_no_targets(self, settings_none):
         """Test config endpoint with no configured targets."""
-        app = create_app(settings_none)
-        with TestClient(app) as client:
-            response = client.get("/config")
-            assert response.status_code == 200
-            data = response.json()
-            assert data["bluesky_configured"] is False
-            assert data["discord_configured"] is False
-            assert data["configured_targets"] == []
+        # /config reads settings only, so skip the lifespan: running it would
+        # reset the publisher manager shared with this module's client
+        client = TestClient(create_app(settings_none))
+        response = client.get("/config")
+        assert response.status_code == 200
+        data = response.json()
+        assert data["bluesky_configured"] is False
+        assert data["discord_configured"] is False
+        assert data["configured_targets"] == []
 
 
 class TestPublishEndpoint:
@@ -66,92 +85,159 @@ class TestPublishEndpoint:
 
     def test_publish_success(self, client):
         """Test successful publish to all targets."""
-        with patch(
-            "falcon_messenger.publishers.bluesky.BlueskyPublisher.publish",
-            new_callable=AsyncMock,
-            return_value=PublishResult(success=True, post_uri="at://test/post/123"),
-        ), patch(
-            "falcon_messenger.publishers.discord.DiscordPublisher.publish",
-            new_callable=AsyncMock,
-            return_value=PublishResult(success=True, message_id="456"),
-        ):
-            response = client.post("/publish", json={"message": "Test message"})
-            assert response.status_code == 200
-            data = response.json()
-            assert data["success"] is True
-            assert "bluesky" in data["results"]
-            assert "discord" in data["results"]
-            assert data["results"]["bluesky"]["success"] is True
-            assert data["results"]["discord"]["success"] is True
+        response = client.post("/publish", json={"message": "Test message"})
+        assert response.status_code == 200
+        data = response.json()
+        assert data["success"] is True
+        assert "bluesky" in data["results"]
+        assert "discord" in data["results"]
+        assert data["results"]["bluesky"]["success"] is True
+        assert data["results"]["discord"]["success"] is True
 
-    def test_publish_to_specific_target(self, client):
+    def test_publish_to_specific_target(self, client, mock_publish):
         """Test publishing to a specific target."""
-        with patch(
-            "falcon_messenger.publishers.bluesky.BlueskyPublisher.publish",
-            new_callable=AsyncMock,
-            return_value=PublishResult(success=True, post_uri="at://test/post/123"),
-        ):
-            response = client.post(
-                "/publish", json={"message": "Test message", "targets": ["bluesky"]}
-            )
-            assert response.status_code == 200
-            data = response.json()
-            assert data["success"] is True
-            assert "bluesky" in data["results"]
-            assert "discord" not in data["results"]
+        response = client.post(
+            "/publish", json={"message": "Test message", "targets": ["bluesky"]}
+        )
+        assert response.status_code == 200
+        data = response.json()
+        assert data["success"] is True
+        assert "bluesky" in data["results"]
+        assert "discord" not in data["results"]
+        mock_publish.discord.assert_not_called()
 
-    def test_publish_handles_failure(self, client):
+    def test_publish_handles_failure(self, client, mock_publish):
         """Test that publish handles failures gracefully."""
-        with patch(
-            "falcon_messenger.publishers.bluesky.BlueskyPublisher.publish",
-            new_callable=AsyncMock,
-            return_value=PublishResult(success=False, error="Auth failed"),
-        ), patch(
-            "falcon_messenger.publishers.discord.DiscordPublisher.publish",
-            new_callable=AsyncMock,
-            return_value=PublishResult(success=True, message_id="456"),
-        ):
-            response = client.post("/publish", json={"message": "Test message"})
-            assert response.status_code == 200
-            data = response.json()
-            assert data["success"] is False
-            assert data["results"]["bluesky"]["success"] is False
-            assert data["results"]["bluesky"]["error"] == "Auth failed"
-            assert data["results"]["discord"]["success"] is True
+        mock_publish.bluesky.return_value = BLUESKY_FAILED
+
+        response = client.post("/publish", json={"message": "Test message"})
+        assert response.status_code == 200
+        data = response.json()
+        assert data["success"] is False
+        assert data["results"]["bluesky"]["success"] is False
+        assert data["results"]["bluesky"]["error"] == "Auth failed"
+        assert data["results"]["discord"]["success"] is True
 
-    def test_publish_with_metadata(self, client):
+    def test_publish_with_metadata(self, client, mock_publish):
         """Test publishing with super-signal metadata for formatting."""
+        response = client.post(
+            "/publish",
+            json={
+                "message": "Stock alert",
+                "metadata": {
+                    "source": "super-signal",
+                    "ticker": "AAPL",
+                    "risk_count": 3,
+                },
+            },
+        )
+        assert response.status_code == 200
+
+        # Check that the formatter was applied
+        call_args = mock_publish.bluesky.call_args
+        formatted_message = call_args[0][0]
+        assert "AAPL" in formatted_message
+        assert "Risk flags: 3" in formatted_message
+
+    def test_publish_with_non_string_source(self, client, mock_publish):
+        """Test that metadata with a non-string source is left unformatted."""
+        response = client.post(
+            "/publish",
+            json={"message": "Stock alert", "metadata": {"source": [], "ticker": "AAPL"}},
+        )
+        assert response.status_code == 200
+        assert mock_publish.bluesky.call_args[0][0] == "Stock alert"
+
+    def test_publish_invalid_targets(self, client):
+        """Test publishing with invalid targets."""
+        response = client.post(
+            "/publish", json={"message": "Test", "targets": ["invalid_target"]}
+        )
+        assert response.status_code == 400
+
+    def test_publish_invalid_image_data(self, client):
+        """Test publishing with malformed base64 image data."""
+        response = client.post("/publish", json={"message": "Test", "image_data": "abc"})
+        assert response.status_code == 400
+        assert "Invalid base64" in response.json()["detail"]
+
+    def test_publish_image_data_type_sniffed(self, client, mock_publish):
+        """Test that base64 images are typed from their content."""
+        response = client.post(
+            "/publish",
+            json={"message": "Chart", "targets": ["discord"], "image_data": "/9j/4AAQ"},
+        )
+        assert response.status_code == 200
+        mock_publish.discord.assert_called_once_with(
+            "Chart", b"\xff\xd8\xff\xe0\x00\x10", "image/jpeg"
+        )
+
+    def test_publish_with_image_url(self, client, mock_publish):
+        """Test that images fetched by URL are typed from their content."""
+        png = b"\x89PNG\r\n\x1a\n" + b"\x00" * 16
+        response = MagicMock()
+        response.content = png
+        response.headers = {"content-type": "application/octet-stream"}
+
         with patch(
-            "falcon_messenger.publishers.bluesky.BlueskyPublisher.publish",
-            new_callable=AsyncMock,
-            return_value=PublishResult(success=True, post_uri="at://test/post/123"),
-        ) as mock_bluesky, patch(
-            "falcon_messenger.publishers.discord.DiscordPublisher.publish",
-            new_callable=AsyncMock,
-            return_value=PublishResult(success=True, message_id="456"),
-        ):
-            response = client.post(
+            "httpx.AsyncClient.get", new_callable=AsyncMock, return_value=response
+        ) as mock_get:
+            result = client.post(
                 "/publish",
                 json={
-                    "message": "Stock alert",
-                    "metadata": {
-                        "source": "super-signal",
-                        "ticker": "AAPL",
-                        "risk_count": 3,
-                    },
+                    "message": "Chart",
+                    "targets": ["discord"],
+                    "image_url": "https://cdn.test/chart",
                 },
             )
-            assert response.status_code == 200
+            assert result.status_code == 200
+            mock_get.assert_awaited_once_with("https://cdn.test/chart")
+            mock_publish.discord.assert_called_once_with("Chart", png, "image/png")
 
-            # Check that the formatter was applied
-            call_args = mock_bluesky.call_args
-            formatted_message = call_args[0][0]
-            assert "AAPL" in formatted_message
-            assert "Risk flags: 3" in formatted_message
 
-    def test_publish_invalid_targets(self, client):
-        """Test publishing with invalid targets."""
+class TestPublishUploadEndpoint:
+    """Tests for the /publish/upload endpoint."""
+
+    def test_upload_with_image(self, client, mock_publish):
+        """Test publishing with a multipart image upload."""
         response = client.post(
-            "/publish", json={"message": "Test", "targets": ["invalid_target"]}
+            "/publish/upload",
+            data={"message": "Chart", "targets": ["discord"]},
+            files={"image": ("chart.jpg", b"fake image data", "image/jpeg")},
+        )
+        assert response.status_code == 200
+        data = response.json()
+        assert data["success"] is True
+        assert "bluesky" not in data["results"]
+        mock_publish.discord.assert_called_once_with("Chart", b"fake image data", "image/jpeg")
+
+    def test_upload_image_type_sniffed(self, client, mock_publish):
+        """Test that the uploaded image type comes from its bytes, not the part header."""
+        png = b"\x89PNG\r\n\x1a\n" + b"\x00" * 16
+        response = client.post(
+            "/publish/upload",
+            data={"message": "Chart", "targets": ["discord"]},
+            files={"image": ("chart.jpg", png, "image/jpeg")},
+        )
+        assert response.status_code == 200
+        mock_publish.discord.assert_called_once_with("Chart", png, "image/png")
+
+    def test_upload_with_metadata(self, client, mock_publish):
+        """Test that JSON-encoded metadata is parsed and used for formatting."""
+        response = client.post(
+            "/publish/upload",
+            data={
+                "message": "Stock alert",
+                "targets": ["bluesky"],
+                "metadata": '{"source": "super-signal", "ticker": "AAPL"}',
+            },
+        )
+        assert response.status_code == 200
+        assert "AAPL" in mock_publish.bluesky.call_args[0][0]
+
+    def test_upload_invalid_metadata(self, client):
+        """Test that malformed metadata JSON is rejected."""
+        response = client.post(
+            "/publish/upload", data={"message": "Test", "metadata": "{not json"}
         )
         assert response.status_code == 400